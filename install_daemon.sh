@@ -211,7 +211,7 @@ install_dependencies() {
     
     # macOS特定依赖
     if [ "$OS" = "macos" ]; then
-        pip install pyobjc-framework-Cocoa pyobjc-framework-Quartz
+        pip install pyobjc-framework-Cocoa pyobjc-framework-Quartz pyobjc-framework-ApplicationServices
     fi
     
     print_success "依赖安装完成"
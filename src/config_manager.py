@@ -2,7 +2,7 @@
 import os
 import yaml
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -99,6 +99,11 @@ class ConfigManager:
         self._websites: Dict[str, WebsiteConfig] = {}
         self._settings: SettingsConfig = SettingsConfig()
         self._last_used: Dict[str, str] = {}
+        # Bumped whenever app/settings configuration changes, so callers can
+        # cache values derived from it
+        self._config_version = 0
+        # (runtime dir mtime, latest session) for get_latest_interactive_session
+        self._latest_session_cache: Optional[tuple] = None
         
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -119,6 +124,7 @@ class ConfigManager:
             success &= self._load_websites()
             success &= self._load_settings()
             success &= self._load_last_used()
+            self._config_version += 1
             
             logger.info("Configuration reloaded successfully")
             
@@ -158,6 +164,14 @@ class ConfigManager:
         """
         return self._settings
     
+    def get_config_version(self) -> int:
+        """Get the current configuration version.
+        
+        Returns:
+            Counter that changes whenever apps or settings are modified
+        """
+        return self._config_version
+    
     def get_all_apps(self) -> Dict[str, AppConfig]:
         """Get all application configurations.
         
@@ -252,6 +266,7 @@ class ConfigManager:
             with open(pid_file, 'w') as f:
                 json.dump(session_info, f)
             
+            self._latest_session_cache = None
             logger.info(f"【hotkey】Registered interactive session: PID={pid}, window={window_id}")  # 注册交互会话
             return True
             
@@ -275,6 +290,7 @@ class ConfigManager:
             runtime_dir = Path(tempfile.gettempdir()) / "terminal_controller"
             pid_file = runtime_dir / f"tc_interactive_{pid}.pid"
             
+            self._latest_session_cache = None
             if pid_file.exists():
                 pid_file.unlink()
                 logger.info(f"【hotkey】Unregistered interactive session: PID={pid}")  # 注销交互会话
@@ -344,6 +360,55 @@ class ConfigManager:
             logger.error(f"Failed to get active interactive sessions: {e}")
             return []
     
+    def get_latest_interactive_session(self) -> Optional[Dict[str, Any]]:
+        """Get the most recently started active interactive TC session.
+        
+        Sessions are registered by other processes, so the result is cached
+        against the runtime directory's mtime, which changes whenever a PID
+        file is added or removed, and the newest PID file mtime, which changes
+        when a session file is rewritten in place.
+        
+        Returns:
+            Session information or None if no session is active
+        """
+        try:
+            import psutil
+            import tempfile
+            from pathlib import Path
+            
+            runtime_dir = Path(tempfile.gettempdir()) / "terminal_controller"
+            if not runtime_dir.exists():
+                self._latest_session_cache = None
+                return None
+            
+            cached = self._latest_session_cache
+            if cached is not None and cached[0] == self._session_files_stamp(runtime_dir):
+                latest = cached[1]
+                if latest is None or psutil.pid_exists(latest.get("pid")):
+                    return latest
+            
+            active_sessions = self.get_active_interactive_sessions()
+            latest = max(active_sessions, key=lambda s: s.get('started_at', 0)) if active_sessions else None
+            
+            # Stat after the scan, which may have removed stale PID files
+            self._latest_session_cache = (self._session_files_stamp(runtime_dir), latest)
+            return latest
+            
+        except Exception as e:
+            logger.error(f"Failed to get latest interactive session: {e}")
+            return None
+    
+    @staticmethod
+    def _session_files_stamp(runtime_dir) -> Tuple[int, int]:
+        """Return (runtime dir mtime, newest PID file mtime) in nanoseconds."""
+        newest = 0
+        for pid_file in runtime_dir.glob("tc_interactive_*.pid"):
+            try:
+                newest = max(newest, pid_file.stat().st_mtime_ns)
+            except OSError:
+                continue
+        return runtime_dir.stat().st_mtime_ns, newest
+    
     def add_app(self, app_id: str, config: AppConfig) -> bool:
         """Add or update an application configuration.
         
@@ -356,6 +421,7 @@ class ConfigManager:
         """
         try:
             self._apps[app_id] = config
+            self._config_version += 1
             return self._save_apps()
         except Exception as e:
             logger.error(f"Failed to add app {app_id}: {e}")
@@ -373,6 +439,7 @@ class ConfigManager:
         try:
             if app_id in self._apps:
                 del self._apps[app_id]
+                self._config_version += 1
                 return self._save_apps()
             return True
         except Exception as e:
@@ -425,6 +492,7 @@ class ConfigManager:
         """
         try:
             self._settings = settings
+            self._config_version += 1
             return self._save_settings()
         except Exception as e:
             logger.error(f"Failed to update settings: {e}")
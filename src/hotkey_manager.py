@@ -1,11 +1,15 @@
 """Hotkey management module for Terminal Controller."""
+import functools
 import logging
+import re
 import threading
 import time
-from typing import Dict, Callable, Optional, List
+import types
+from typing import Dict, Callable, Optional, List, Tuple, Mapping, Set, Pattern
 from dataclasses import dataclass
 
-from .platform import get_platform_adapter, PlatformAdapter
+from .platform import get_platform_adapter, PlatformAdapter, CURRENT_PLATFORM
+from .platform.base import _DATACLASS_SLOTS
 from .config_manager import ConfigManager
 
 
@@ -16,13 +20,25 @@ PERF_LOG_PREFIX = "[PERF]"
 
 def log_perf(msg: str, duration_ms: Optional[float] = None):
     """统一的性能日志记录函数"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if duration_ms is not None:
         logger.info(f"{PERF_LOG_PREFIX} {msg} - {duration_ms:.2f}ms")
     else:
         logger.info(f"{PERF_LOG_PREFIX} {msg}")
 
 
-@dataclass
+# Common terminal application names, matched as lowercase substrings
+TERMINAL_NAMES = (
+    'terminal', 'iterm', 'konsole', 'gnome-terminal',
+    'xfce4-terminal', 'cmd', 'powershell', 'windows terminal'
+)
+
+# Binding ids with this prefix are owned by _register_configured_hotkeys
+CONFIG_BINDING_PREFIX = 'config_'
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class HotkeyBinding:
     """Represents a hotkey binding."""
     hotkey: str
@@ -34,6 +50,13 @@ class HotkeyBinding:
 class HotkeyManager:
     """Manages global hotkey registration and handling."""
     
+    # Platform -> HotkeyConfig attribute holding the terminal hotkey
+    _PLATFORM_HOTKEY_ATTR = {
+        "darwin": "terminal",
+        "linux": "terminal_linux",
+        "windows": "terminal_windows",
+    }
+    
     def __init__(self, config_manager: ConfigManager):
         """Initialize the hotkey manager.
         
@@ -42,21 +65,23 @@ class HotkeyManager:
         """
         self.config_manager = config_manager
         self.platform_adapter: PlatformAdapter = get_platform_adapter()()
-        import sys
-        # 避免命名冲突，直接使用sys.platform
-        p = sys.platform.lower()
-        if p.startswith("darwin") or p in ("mac", "macos"):
-            self.current_platform = "darwin"
-        elif p.startswith("linux"):
-            self.current_platform = "linux"
-        elif p.startswith("win"):
-            self.current_platform = "windows"
-        else:
-            self.current_platform = p
+        self.current_platform = CURRENT_PLATFORM
         
         self._bindings: Dict[str, HotkeyBinding] = {}
+        # Ids of bindings registered from configuration (CONFIG_BINDING_PREFIX)
+        self._configured_binding_ids: Set[str] = set()
+        # hotkey -> (binding_id, callback), looked up by _dispatch on every press
+        self._dispatch_table: Dict[str, Tuple[str, Callable]] = {}
+        # (config version, compiled terminal name pattern) used by _is_terminal_window
+        self._terminal_pattern_cache: Optional[Tuple[int, Pattern[str]]] = None
+        # (config version, hotkey) cached by get_platform_hotkey
+        self._platform_hotkey_cache: Optional[Tuple[int, Optional[str]]] = None
+        # Created lazily by the terminal hotkey callback
+        self._terminal_manager = None
+        self._window_manager = None
         self._active = False
-        self._lock = threading.RLock()  # Use RLock to allow re-entrance
+        # Plain Lock: locked sections call the _locked helpers, never public methods
+        self._lock = threading.Lock()
         
         logger.info(f"Initialized HotkeyManager for platform: {self.current_platform}")
     
@@ -102,11 +127,16 @@ class HotkeyManager:
                     logger.warning("HotkeyManager is not active")
                     return True
                 
-                # Unregister all hotkeys
+                # Unregister all hotkeys, in one platform call when supported
                 success = True
-                for binding_id in list(self._bindings.keys()):
-                    if not self.unregister_hotkey(binding_id):
-                        success = False
+                if self.platform_adapter.unregister_all_hotkeys():
+                    self._bindings.clear()
+                    self._configured_binding_ids.clear()
+                    self._dispatch_table.clear()
+                else:
+                    for binding_id in list(self._bindings.keys()):
+                        if not self._unregister_hotkey_locked(binding_id):
+                            success = False
                 
                 self._active = False
                 logger.info("HotkeyManager stopped")
@@ -132,39 +162,50 @@ class HotkeyManager:
         """
         try:
             with self._lock:
-                if binding_id in self._bindings:
-                    logger.warning(f"Hotkey binding {binding_id} already exists, replacing")
-                    self.unregister_hotkey(binding_id)
-                
-                # Create wrapper callback for error handling
-                def safe_callback():
-                    try:
-                        callback()
-                    except Exception as e:
-                        logger.error(f"【hotkey】Error in hotkey callback for {binding_id}: {e}")
-                
-                logger.info(f"【hotkey】Registering hotkey binding: id={binding_id}, hotkey={hotkey}, desc='{description}'")
-
-                # Register with platform adapter
-                success = self.platform_adapter.register_hotkey(hotkey, safe_callback)
-                logger.info(f"【hotkey】Platform adapter register_hotkey result for {binding_id}: {success}")
-                
-                if success:
-                    self._bindings[binding_id] = HotkeyBinding(
-                        hotkey=hotkey,
-                        callback=callback,
-                        description=description
-                    )
-                    logger.info(f"【hotkey】Registered hotkey {hotkey} for {binding_id}")
-                else:
-                    logger.error(f"【hotkey】Failed to register hotkey {hotkey} for {binding_id}")
-                
-                return success
+                return self._register_hotkey_locked(binding_id, hotkey, callback, description)
                 
         except Exception as e:
             logger.error(f"【hotkey】Error registering hotkey {binding_id}: {e}")
             return False
     
+    def _register_hotkey_locked(self, binding_id: str, hotkey: str,
+                                callback: Callable, description: str = "") -> bool:
+        """Register a hotkey binding; the caller must hold self._lock."""
+        if binding_id in self._bindings:
+            logger.warning(f"Hotkey binding {binding_id} already exists, replacing")
+            self._unregister_hotkey_locked(binding_id)
+        
+        logger.info(f"【hotkey】Registering hotkey binding: id={binding_id}, hotkey={hotkey}, desc='{description}'")
+
+        # Register with platform adapter; presses are routed through _dispatch
+        previous_entry = self._dispatch_table.get(hotkey)
+        entry = (binding_id, callback)
+        self._dispatch_table[hotkey] = entry
+        success = self.platform_adapter.register_hotkey(
+            hotkey, functools.partial(self._dispatch, hotkey)
+        )
+        logger.info(f"【hotkey】Platform adapter register_hotkey result for {binding_id}: {success}")
+        
+        if success:
+            self._bindings[binding_id] = HotkeyBinding(
+                hotkey=hotkey,
+                callback=callback,
+                description=description
+            )
+            if binding_id.startswith(CONFIG_BINDING_PREFIX):
+                self._configured_binding_ids.add(binding_id)
+            logger.info(f"【hotkey】Registered hotkey {hotkey} for {binding_id}")
+        else:
+            # Only undo our own entry; an existing binding of this hotkey keeps working
+            if self._dispatch_table.get(hotkey) is entry:
+                if previous_entry is None:
+                    del self._dispatch_table[hotkey]
+                else:
+                    self._dispatch_table[hotkey] = previous_entry
+            logger.error(f"【hotkey】Failed to register hotkey {hotkey} for {binding_id}")
+        
+        return success
+    
     def unregister_hotkey(self, binding_id: str) -> bool:
         """Unregister a hotkey binding.
         
@@ -176,25 +217,31 @@ class HotkeyManager:
         """
         try:
             with self._lock:
-                if binding_id not in self._bindings:
-                    logger.warning(f"Hotkey binding {binding_id} not found")
-                    return False
-                
-                binding = self._bindings[binding_id]
-                success = self.platform_adapter.unregister_hotkey(binding.hotkey)
-                
-                if success:
-                    del self._bindings[binding_id]
-                    logger.info(f"Unregistered hotkey {binding.hotkey} for {binding_id}")
-                else:
-                    logger.error(f"Failed to unregister hotkey {binding.hotkey} for {binding_id}")
-                
-                return success
+                return self._unregister_hotkey_locked(binding_id)
                 
         except Exception as e:
             logger.error(f"Error unregistering hotkey {binding_id}: {e}")
             return False
     
+    def _unregister_hotkey_locked(self, binding_id: str) -> bool:
+        """Unregister a hotkey binding; the caller must hold self._lock."""
+        binding = self._bindings.get(binding_id)
+        if binding is None:
+            logger.warning(f"Hotkey binding {binding_id} not found")
+            return False
+        
+        success = self.platform_adapter.unregister_hotkey(binding.hotkey)
+        
+        if success:
+            del self._bindings[binding_id]
+            self._configured_binding_ids.discard(binding_id)
+            self._dispatch_table.pop(binding.hotkey, None)
+            logger.info(f"Unregistered hotkey {binding.hotkey} for {binding_id}")
+        else:
+            logger.error(f"Failed to unregister hotkey {binding.hotkey} for {binding_id}")
+        
+        return success
+    
     def enable_hotkey(self, binding_id: str) -> bool:
         """Enable a disabled hotkey binding.
         
@@ -206,11 +253,11 @@ class HotkeyManager:
         """
         try:
             with self._lock:
-                if binding_id not in self._bindings:
+                binding = self._bindings.get(binding_id)
+                if binding is None:
                     logger.error(f"Hotkey binding {binding_id} not found")
                     return False
                 
-                binding = self._bindings[binding_id]
                 if binding.enabled:
                     logger.warning(f"Hotkey binding {binding_id} is already enabled")
                     return True
@@ -218,7 +265,7 @@ class HotkeyManager:
                 # Re-register the hotkey
                 success = self.platform_adapter.register_hotkey(
                     binding.hotkey, 
-                    binding.callback
+                    functools.partial(self._dispatch, binding.hotkey)
                 )
                 
                 if success:
@@ -242,11 +289,11 @@ class HotkeyManager:
         """
         try:
             with self._lock:
-                if binding_id not in self._bindings:
+                binding = self._bindings.get(binding_id)
+                if binding is None:
                     logger.error(f"Hotkey binding {binding_id} not found")
                     return False
                 
-                binding = self._bindings[binding_id]
                 if not binding.enabled:
                     logger.warning(f"Hotkey binding {binding_id} is already disabled")
                     return True
@@ -264,8 +311,36 @@ class HotkeyManager:
             logger.error(f"Error disabling hotkey {binding_id}: {e}")
             return False
     
-    def get_bindings(self) -> Dict[str, HotkeyBinding]:
-        """Get all hotkey bindings.
+    def _dispatch(self, hotkey: str) -> None:
+        """Invoke the callback bound to a hotkey, logging any error.
+        
+        Args:
+            hotkey: Hotkey string that was pressed
+        """
+        entry = self._dispatch_table.get(hotkey)
+        if entry is None:
+            return
+        
+        binding_id, callback = entry
+        try:
+            callback()
+        except Exception as e:
+            logger.error("【hotkey】Error in hotkey callback for %s: %s", binding_id, e)
+    
+    def get_bindings(self) -> Mapping[str, HotkeyBinding]:
+        """Get a read-only live view of all hotkey bindings.
+        
+        The view is not locked: iterating it while another thread registers,
+        unregisters or reloads hotkeys can raise RuntimeError. Callers that
+        iterate from other threads should use snapshot_bindings() instead.
+        
+        Returns:
+            Mapping of all hotkey bindings; use snapshot_bindings() for a copy
+        """
+        return types.MappingProxyType(self._bindings)
+    
+    def snapshot_bindings(self) -> Dict[str, HotkeyBinding]:
+        """Get a copy of all hotkey bindings.
         
         Returns:
             Dictionary of all hotkey bindings
@@ -302,16 +377,15 @@ class HotkeyManager:
         """
         try:
             logger.info("Reloading hotkey configuration")
+            self._platform_hotkey_cache = None
             
-            # Unregister existing configured hotkeys
-            configured_bindings = [bid for bid in self._bindings.keys() 
-                                 if bid.startswith('config_')]
-            
-            for binding_id in configured_bindings:
-                self.unregister_hotkey(binding_id)
-            
-            # Re-register configured hotkeys
-            return self._register_configured_hotkeys()
+            with self._lock:
+                # Unregister existing configured hotkeys
+                for binding_id in list(self._configured_binding_ids):
+                    self._unregister_hotkey_locked(binding_id)
+                
+                # Re-register configured hotkeys
+                return self._register_configured_hotkeys()
             
         except Exception as e:
             logger.error(f"Error reloading hotkey configuration: {e}")
@@ -323,35 +397,39 @@ class HotkeyManager:
         Returns:
             Formatted string of all hotkey bindings
         """
+        # Snapshot under the lock, format outside it to keep the hold time short
         with self._lock:
-            if not self._bindings:
-                return "No hotkey bindings registered."
-            
-            lines = ["Registered Hotkey Bindings:"]
-            for binding_id, binding in self._bindings.items():
-                status = "enabled" if binding.enabled else "disabled"
-                description = binding.description or "No description"
-                lines.append(f"  {binding_id}: {binding.hotkey} ({status}) - {description}")
-            
-            return "\n".join(lines)
+            items = list(self._bindings.items())
+
+        if not items:
+            return "No hotkey bindings registered."
+
+        return "Registered Hotkey Bindings:\n" + "\n".join(
+            f"  {binding_id}: {binding.hotkey} ({'enabled' if binding.enabled else 'disabled'})"
+            f" - {binding.description or 'No description'}"
+            for binding_id, binding in items
+        )
     
-    def get_platform_hotkey(self) -> str:
+    def get_platform_hotkey(self) -> Optional[str]:
         """Get platform-specific hotkey string.
+        
+        The result is cached until the configuration version changes.
             
         Returns:
             Platform-specific hotkey string
         """
-        settings = self.config_manager.get_settings()
-        
-        if self.current_platform == "darwin":
-            return settings.hotkeys.terminal
-        elif self.current_platform == "linux":
-            return settings.hotkeys.terminal_linux
-        elif self.current_platform == "windows":
-            return settings.hotkeys.terminal_windows
+        version = self.config_manager.get_config_version()
+        cached = self._platform_hotkey_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        attr = self._PLATFORM_HOTKEY_ATTR.get(self.current_platform)
+        hotkey = getattr(self.config_manager.get_settings().hotkeys, attr) if attr else None
+        self._platform_hotkey_cache = (version, hotkey)
+        return hotkey
     
     def _register_configured_hotkeys(self) -> bool:
-        """Register hotkeys from configuration.
+        """Register hotkeys from configuration; the caller must hold self._lock.
         
         Returns:
             True if all configured hotkeys were registered successfully
@@ -366,7 +444,7 @@ class HotkeyManager:
             if terminal_hotkey:
                 logger.info(f"【hotkey】Creating terminal callback and registering hotkey...")
                 terminal_callback = self._create_terminal_callback()
-                register_result = self.register_hotkey(
+                register_result = self._register_hotkey_locked(
                     "config_terminal", 
                     terminal_hotkey, 
                     terminal_callback,
@@ -396,29 +474,35 @@ class HotkeyManager:
             Callback function that toggles terminal visibility
         """
         logger.info("Creating terminal callback function")
+        # Import here to avoid circular imports; bound once per callback, not per press
+        from .terminal_manager import TerminalManager
+        from .window_manager import WindowManager
+        
         def terminal_callback():
             try:
-                import time
                 logger.info("【hotkey_triggered】Terminal hotkey callback triggered")  # 热键回调触发的日志
                 
-                # Import here to avoid circular imports
-                from .terminal_manager import TerminalManager
-                from .window_manager import WindowManager
-                
-                terminal_manager = TerminalManager(self.config_manager)
-                window_manager = WindowManager(self.config_manager)
-                
-                action_start_time = time.time()
-                success = self._smart_focus_terminal(window_manager, terminal_manager)
-                action_time = (time.time() - action_start_time) * 1000
-                logger.info(f"【hotkey_triggered】Smart focus terminal completed - {action_time:.2f}ms, success: {success}")  # 智能聚焦终端耗时
+                # Managers are created on the first press and reused afterwards
+                if self._terminal_manager is None:
+                    self._terminal_manager = TerminalManager(self.config_manager)
+                if self._window_manager is None:
+                    self._window_manager = WindowManager(self.config_manager)
+                terminal_manager = self._terminal_manager
+                window_manager = self._window_manager
+                
+                action_start_ns = time.monotonic_ns()
+                # One hotkey press shares a single window/app snapshot across its queries
+                with window_manager.platform_adapter.oneshot():
+                    success = self._smart_focus_terminal(window_manager, terminal_manager)
+                action_time = (time.monotonic_ns() - action_start_ns) / 1e6
+                logger.info("【hotkey_triggered】Smart focus terminal completed - %.2fms, success: %s", action_time, success)  # 智能聚焦终端耗时
                 if success:
                     logger.info("【hotkey_triggered】Smart terminal focus completed via hotkey")
                 else:
                     logger.error("【hotkey_triggered】Failed to focus/launch terminal via hotkey")
                     
             except Exception as e:
-                logger.error(f"【hotkey_triggered】Error in terminal hotkey callback: {e}")
+                logger.error("【hotkey_triggered】Error in terminal hotkey callback: %s", e)
         
         return terminal_callback
     
@@ -460,30 +544,39 @@ class HotkeyManager:
             True if window is a terminal, False otherwise
         """
         try:
-            # Get list of available terminal applications
-            available_terminals = terminal_manager.get_available_terminals()
-            
-            for terminal_id in available_terminals:
-                terminal_config = self.config_manager.get_app_config(terminal_id)
-                if terminal_config and terminal_config.name.lower() in window_info.app_name.lower():
-                    return True
-            
-            # Also check common terminal application names
-            terminal_names = [
-                'terminal', 'iterm', 'konsole', 'gnome-terminal', 
-                'xfce4-terminal', 'cmd', 'powershell', 'windows terminal'
-            ]
-            
-            for term_name in terminal_names:
-                if term_name in window_info.app_name.lower():
-                    return True
-                    
-            return False
+            pattern = self._get_terminal_name_pattern(terminal_manager)
+            return pattern.search(window_info.app_name_lower) is not None
             
         except Exception as e:
             logger.error(f"Error checking if window is terminal: {e}")
             return False
     
+    def _get_terminal_name_pattern(self, terminal_manager) -> Pattern[str]:
+        """Get a compiled pattern matching lowercase terminal application names.
+        
+        The pattern is rebuilt only when the configuration version changes.
+        
+        Args:
+            terminal_manager: TerminalManager instance
+            
+        Returns:
+            Alternation of configured terminal names and common terminal names
+        """
+        version = self.config_manager.get_config_version()
+        cached = self._terminal_pattern_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        names = set(TERMINAL_NAMES)
+        for terminal_id in terminal_manager.get_available_terminals():
+            terminal_config = self.config_manager.get_app_config(terminal_id)
+            if terminal_config and terminal_config.name:
+                names.add(terminal_config.name.lower())
+        
+        pattern = re.compile("|".join(re.escape(name) for name in sorted(names)))
+        self._terminal_pattern_cache = (version, pattern)
+        return pattern
+    
     # todo 阅读这段逻辑，寻找回到tc终端流程的优化点，考虑复用这个找到终端的逻辑到找到其他程序的特定窗口
     def _smart_focus_terminal(self, window_manager, terminal_manager) -> bool:
         """Smart terminal focus logic when current window is not a terminal.
@@ -496,28 +589,24 @@ class HotkeyManager:
             True if successfully focused/launched terminal, False otherwise
         """
         try:
-            import time
-            
-            # 【hotkey】查找活跃的交互会话 - 精确识别运行TC的终端
-            sessions_start_time = time.time()
-            active_sessions = self.config_manager.get_active_interactive_sessions()
-            sessions_time = (time.time() - sessions_start_time) * 1000
-            logger.info(f"【hotkey_triggered】Get active interactive sessions - {sessions_time:.2f}ms, count: {len(active_sessions)}")  # 获取活跃交互会话耗时
+            # 【hotkey】查找最近启动的活跃交互会话 - 精确识别运行TC的终端
+            sessions_start_ns = time.monotonic_ns()
+            latest_session = self.config_manager.get_latest_interactive_session()
+            sessions_time = (time.monotonic_ns() - sessions_start_ns) / 1e6
+            logger.info("【hotkey_triggered】Get latest interactive session - %.2fms, found: %s", sessions_time, latest_session is not None)  # 获取最近交互会话耗时
             
-            # 如果找到活跃的交互会话，优先切换到这些终端
-            if active_sessions:
-                # 选择最近启动的会话（通常是用户最后使用的）
-                latest_session = max(active_sessions, key=lambda s: s.get('started_at', 0))
+            # 如果找到活跃的交互会话，优先切换到该终端（通常是用户最后使用的）
+            if latest_session:
                 session_window_id = latest_session.get('window_id')
                 
                 if session_window_id:
-                    activate_start_time = time.time()
+                    activate_start_ns = time.monotonic_ns()
                     success = window_manager.activate_window_by_id(session_window_id)
-                    activate_time = (time.time() - activate_start_time) * 1000
-                    logger.info(f"【hotkey_triggered】Activate interactive session window - {activate_time:.2f}ms, success: {success}")  # 激活交互会话窗口耗时
+                    activate_time = (time.monotonic_ns() - activate_start_ns) / 1e6
+                    logger.info("【hotkey_triggered】Activate interactive session window - %.2fms, success: %s", activate_time, success)  # 激活交互会话窗口耗时
                     
                     if success:
-                        logger.debug(f"Focused active interactive session: {session_window_id}")
+                        logger.debug("Focused active interactive session: %s", session_window_id)
                         return True
             
             return False
@@ -17,12 +17,16 @@ def _normalize_sys_platform() -> str:
     return p
 
 
+# sys.platform cannot change within a process, so normalize it once
+CURRENT_PLATFORM = _normalize_sys_platform()
+
+
 def get_platform_adapter() -> Type[PlatformAdapter]:
     """Get the appropriate platform adapter based on the current OS.
 
     Avoid importing stdlib 'platform' to prevent name collision with local package 'platform'.
     """
-    system = _normalize_sys_platform()
+    system = CURRENT_PLATFORM
     
     if system == "darwin":
         # Use optimized macOS adapter globally for better performance
@@ -38,4 +42,4 @@ def get_platform_adapter() -> Type[PlatformAdapter]:
         raise RuntimeError(f"Unsupported platform: {system}")
 
 
-__all__ = ["PlatformAdapter", "get_platform_adapter"]
+__all__ = ["PlatformAdapter", "get_platform_adapter", "CURRENT_PLATFORM"]
@@ -1,10 +1,16 @@
 """Base platform adapter interface."""
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions fall back to __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WindowInfo:
     """Information about an application window."""
     window_id: str
@@ -14,9 +20,14 @@ class WindowInfo:
     is_minimized: bool
     position: tuple = (0, 0)
     size: tuple = (0, 0)
+    # Lowercased app_name, computed once for case-insensitive matching
+    app_name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.app_name_lower = self.app_name.lower()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AppInfo:
     """Information about a running application."""
     pid: int
@@ -128,6 +139,27 @@ class PlatformAdapter(ABC):
         """
         pass
     
+    def unregister_all_hotkeys(self) -> bool:
+        """Unregister every global hotkey in a single call.
+        
+        Adapters that cannot do this return False, and callers fall back to
+        unregister_hotkey for each hotkey.
+        
+        Returns:
+            True if all hotkeys were unregistered, False otherwise
+        """
+        return False
+    
+    @contextmanager
+    def oneshot(self):
+        """Group several window/app queries that belong to one user action.
+        
+        Inside the block, adapters may reuse a single window-list and
+        running-application snapshot instead of querying the system for
+        each call. The default implementation does nothing.
+        """
+        yield
+    
     @abstractmethod
     def get_active_window(self) -> Optional[WindowInfo]:
         """Get information about the currently active window.
@@ -1,9 +1,14 @@
 """Linux platform adapter implementation."""
+import functools
 import os
+import shutil
+import signal
+import socket
 import subprocess
+import time
 import psutil
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
 from .base import PlatformAdapter, WindowInfo, AppInfo
 
@@ -17,7 +22,10 @@ except ImportError:
 
 try:
     import Xlib
+    import Xlib.X
     import Xlib.display
+    import Xlib.protocol.event
+    import Xlib.protocol.request
     HAS_XLIB = True
 except ImportError:
     HAS_XLIB = False
@@ -25,18 +33,78 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a psutil process scan is reused before walking /proc again
+PROCESS_CACHE_TTL = 0.25
+
+# X11 protocol values for EWMH client messages (X.CurrentTime, IconicState)
+_X_CURRENT_TIME = 0
+_ICONIC_STATE = 3
+# EWMH source indication: request comes from a pager/tool, not an application
+_EWMH_SOURCE_PAGER = 2
+
+# Seconds to wait for wmctrl/xdotool; a healthy window manager answers in well under this
+WINDOW_COMMAND_TIMEOUT = 1
+
+# Atoms used by the Xlib paths, interned once when the display is opened
+_X_ATOMS = (
+    '_NET_ACTIVE_WINDOW', '_NET_CLOSE_WINDOW', '_NET_CLIENT_LIST', '_NET_WM_NAME',
+    'WM_CHANGE_STATE', 'WM_NAME', 'WM_CLASS', 'UTF8_STRING', 'STRING',
+)
+
+# Modifier names mapped to pynput's hotkey syntax
+_KEY_MAPPING = {
+    'ctrl': '<ctrl>',
+    'alt': '<alt>',
+    'shift': '<shift>',
+    'super': '<cmd>',  # Super key (Windows key)
+    'meta': '<cmd>'
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _which(name: str) -> Optional[str]:
+    """Resolve a command on PATH in-process, memoized for the session."""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_default_terminal() -> str:
+    """Find the first installed terminal; checked once per process."""
+    # Check for common terminal applications
+    terminals = [
+        'gnome-terminal',
+        'konsole',
+        'xfce4-terminal',
+        'terminator',
+        'tilix',
+        'alacritty',
+        'kitty',
+        'xterm'
+    ]
+    
+    for terminal in terminals:
+        if _which(terminal):
+            return terminal
+    
+    # Fallback to xterm
+    return 'xterm'
+
 
 class LinuxAdapter(PlatformAdapter):
     """Linux-specific implementation of platform adapter."""
     
     def __init__(self):
-        self._hotkey_listeners = {}
+        # hotkey -> (pynput key combination, callback), served by one listener
+        self._hotkey_listeners: Dict[str, Tuple[str, Callable]] = {}
         self._running_listener = None
         self._display = None
+        self._proc_cache: Optional[List[psutil.Process]] = None
+        self._proc_cache_ts = 0.0
         
         if HAS_XLIB:
             try:
                 self._display = Xlib.display.Display()
+                self._tune_display()
             except Exception as e:
                 logger.warning(f"Could not connect to X display: {e}")
     
@@ -56,6 +124,7 @@ class LinuxAdapter(PlatformAdapter):
                 stderr=subprocess.DEVNULL,
                 start_new_session=True
             )
+            self._invalidate_procs()
             return True
             
         except Exception as e:
@@ -67,7 +136,7 @@ class LinuxAdapter(PlatformAdapter):
         apps = []
         
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
+            for proc in self._procs():
                 try:
                     proc_info = proc.info
                     name = proc_info['name']
@@ -78,8 +147,8 @@ class LinuxAdapter(PlatformAdapter):
                     app_info = AppInfo(
                         pid=proc_info['pid'],
                         name=name,
-                        executable_path=proc_info['exe'] or "",
-                        windows=self.get_app_windows(name)
+                        executable_path=self._proc_exe(proc),
+                        windows=[]  # Loaded on demand via get_app_windows
                     )
                     apps.append(app_info)
                     
@@ -96,33 +165,26 @@ class LinuxAdapter(PlatformAdapter):
         windows = []
         
         try:
-            # Try using wmctrl first
-            result = subprocess.run(
-                ['wmctrl', '-l'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            windows_by_pid = self._scan_windows_once()
             
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split(None, 3)
-                        if len(parts) >= 4:
-                            window_id = parts[0]
-                            title = parts[3]
-                            
-                            # Check if window belongs to the app
-                            if self._is_window_for_app(window_id, app_name):
-                                windows.append(WindowInfo(
-                                    window_id=window_id,
-                                    title=title,
-                                    app_name=app_name,
-                                    is_active=False,
-                                    is_minimized=False
-                                ))
-            
-            # Fallback to xwininfo if wmctrl fails
+            if windows_by_pid is not None:
+                app_name_lower = app_name.lower()
+                names_by_pid = {proc.info['pid']: proc.info['name'] or "" for proc in self._procs()}
+                for pid, pid_windows in windows_by_pid.items():
+                    # Check if the windows belong to the app
+                    if app_name_lower not in names_by_pid.get(pid, "").lower():
+                        continue
+                    
+                    for window_id, title in pid_windows:
+                        windows.append(WindowInfo(
+                            window_id=window_id,
+                            title=title,
+                            app_name=app_name,
+                            is_active=False,
+                            is_minimized=False
+                        ))
+            
+            # Fallback to Xlib if wmctrl fails
             elif HAS_XLIB and self._display:
                 windows.extend(self._get_windows_xlib(app_name))
                 
@@ -132,24 +194,20 @@ class LinuxAdapter(PlatformAdapter):
         return windows
     
     def activate_window(self, window_id: str) -> bool:
-        """Activate a specific window using wmctrl."""
+        """Activate a specific window via EWMH, falling back to wmctrl."""
+        if self._send_ewmh_message(window_id, '_NET_ACTIVE_WINDOW',
+                                   [_EWMH_SOURCE_PAGER, _X_CURRENT_TIME]):
+            return True
+        
         try:
             # Try wmctrl first
-            result = subprocess.run(
-                ['wmctrl', '-i', '-a', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['wmctrl', '-i', '-a', window_id])
             
             if result.returncode == 0:
                 return True
             
             # Fallback to xdotool
-            result = subprocess.run(
-                ['xdotool', 'windowactivate', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['xdotool', 'windowactivate', window_id])
             
             return result.returncode == 0
             
@@ -159,23 +217,19 @@ class LinuxAdapter(PlatformAdapter):
     
     def minimize_window(self, window_id: str) -> bool:
         """Minimize a specific window."""
+        if self._send_ewmh_message(window_id, 'WM_CHANGE_STATE',
+                                   [_ICONIC_STATE]):
+            return True
+        
         try:
             # Try xdotool
-            result = subprocess.run(
-                ['xdotool', 'windowminimize', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['xdotool', 'windowminimize', window_id])
             
             if result.returncode == 0:
                 return True
             
             # Fallback to wmctrl
-            result = subprocess.run(
-                ['wmctrl', '-i', '-c', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['wmctrl', '-i', '-c', window_id])
             
             return result.returncode == 0
             
@@ -185,23 +239,19 @@ class LinuxAdapter(PlatformAdapter):
     
     def close_window(self, window_id: str) -> bool:
         """Close a specific window."""
+        if self._send_ewmh_message(window_id, '_NET_CLOSE_WINDOW',
+                                   [_X_CURRENT_TIME, _EWMH_SOURCE_PAGER]):
+            return True
+        
         try:
             # Try wmctrl first
-            result = subprocess.run(
-                ['wmctrl', '-i', '-c', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['wmctrl', '-i', '-c', window_id])
             
             if result.returncode == 0:
                 return True
             
             # Fallback to xdotool
-            result = subprocess.run(
-                ['xdotool', 'windowclose', window_id],
-                capture_output=True,
-                timeout=5
-            )
+            result = self._run_window_command(['xdotool', 'windowclose', window_id])
             
             return result.returncode == 0
             
@@ -227,30 +277,21 @@ class LinuxAdapter(PlatformAdapter):
                 except Exception as e:
                     logger.error(f"Hotkey callback error: {e}")
             
-            # Stop existing listener if present
-            if self._running_listener:
-                self._running_listener.stop()
-            
-            # Create new listener
-            self._running_listener = keyboard.GlobalHotKeys({
-                hotkey: on_hotkey
-            })
-            self._running_listener.start()
-            
-            self._hotkey_listeners[hotkey] = self._running_listener
+            self._hotkey_listeners[hotkey] = (key_combination, on_hotkey)
+            self._restart_listener()
             return True
             
         except Exception as e:
             logger.error(f"Failed to register hotkey {hotkey}: {e}")
+            self._hotkey_listeners.pop(hotkey, None)
             return False
     
     def unregister_hotkey(self, hotkey: str) -> bool:
         """Unregister a global hotkey."""
         try:
             if hotkey in self._hotkey_listeners:
-                listener = self._hotkey_listeners[hotkey]
-                listener.stop()
                 del self._hotkey_listeners[hotkey]
+                self._restart_listener()
                 return True
             return False
             
@@ -258,27 +299,70 @@ class LinuxAdapter(PlatformAdapter):
             logger.error(f"Failed to unregister hotkey {hotkey}: {e}")
             return False
     
+    def unregister_all_hotkeys(self) -> bool:
+        """Unregister all global hotkeys at once."""
+        try:
+            self._hotkey_listeners.clear()
+            self._restart_listener()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to unregister all hotkeys: {e}")
+            return False
+    
+    def _restart_listener(self) -> None:
+        """Replace the running listener with one covering every registered hotkey.
+        
+        pynput's GlobalHotKeys takes its mapping at construction, so all
+        hotkeys share a single listener that is rebuilt when the set changes.
+        """
+        if self._running_listener:
+            self._running_listener.stop()
+            self._running_listener = None
+        
+        if self._hotkey_listeners:
+            self._running_listener = keyboard.GlobalHotKeys(
+                dict(self._hotkey_listeners.values())
+            )
+            self._running_listener.start()
+    
     def get_active_window(self) -> Optional[WindowInfo]:
         """Get information about the currently active window."""
+        if self._display:
+            try:
+                root = self._display.screen().root
+                active = root.get_full_property(
+                    self._display.intern_atom('_NET_ACTIVE_WINDOW'),
+                    Xlib.X.AnyPropertyType
+                )
+                if active and active.value and active.value[0]:
+                    window_id = active.value[0]
+                    net_wm_name, wm_name, wm_class = self._get_window_properties(window_id, [
+                        ('_NET_WM_NAME', 'UTF8_STRING'),
+                        ('WM_NAME', 'STRING'),
+                        ('WM_CLASS', 'STRING'),
+                    ])
+                    # WM_CLASS is "instance\0Class\0"; the class names the app
+                    class_parts = wm_class.split('\0') if wm_class else []
+                    
+                    return WindowInfo(
+                        window_id=f"0x{window_id:08x}",
+                        title=net_wm_name or wm_name,
+                        app_name=class_parts[1] if len(class_parts) > 1 else "",
+                        is_active=True,
+                        is_minimized=False
+                    )
+            except Exception as e:
+                logger.debug(f"Xlib active window lookup failed, using xdotool: {e}")
+        
         try:
             # Try using xdotool
-            result = subprocess.run(
-                ['xdotool', 'getactivewindow'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run_window_command(['xdotool', 'getactivewindow'])
             
             if result.returncode == 0:
                 window_id = result.stdout.strip()
                 
                 # Get window title
-                title_result = subprocess.run(
-                    ['xdotool', 'getwindowname', window_id],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
+                title_result = self._run_window_command(['xdotool', 'getwindowname', window_id])
                 
                 title = title_result.stdout.strip() if title_result.returncode == 0 else ""
                 
@@ -297,10 +381,17 @@ class LinuxAdapter(PlatformAdapter):
     
     def is_app_running(self, app_name: str) -> bool:
         """Check if an application is currently running."""
+        needle = app_name.lower()
+        
         try:
-            for proc in psutil.process_iter(['name']):
+            if self._procs_fresh():
+                return any(needle in (proc.info['name'] or "").lower()
+                           for proc in self._proc_cache)
+            
+            # No recent scan: read names one PID at a time and stop at the first match
+            for pid in psutil.pids():
                 try:
-                    if app_name.lower() in proc.info['name'].lower():
+                    if needle in psutil.Process(pid).name().lower():
                         return True
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -312,13 +403,23 @@ class LinuxAdapter(PlatformAdapter):
     
     def kill_app(self, app_name: str, force: bool = False) -> bool:
         """Terminate an application."""
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        killed = False
+        
         try:
-            if force:
-                subprocess.run(['killall', '-9', app_name], check=False)
-            else:
-                subprocess.run(['killall', app_name], check=False)
+            # Match process names exactly, as killall did
+            for proc in self._procs():
+                if proc.info['name'] != app_name:
+                    continue
+                try:
+                    proc.send_signal(sig)
+                    killed = True
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
             
-            return True
+            if killed:
+                self._invalidate_procs()
+            return killed
             
         except Exception as e:
             logger.error(f"Failed to kill app {app_name}: {e}")
@@ -327,15 +428,20 @@ class LinuxAdapter(PlatformAdapter):
     def open_url(self, url: str) -> bool:
         """Open a URL."""
         try:
-            # Try common methods to open URL
-            for cmd in ['xdg-open', 'firefox', 'chromium', 'google-chrome']:
-                try:
-                    subprocess.run([cmd, url], check=False)
+            # Launch the first available opener without waiting for it
+            for cmd in ('xdg-open', 'firefox', 'chromium', 'google-chrome'):
+                path = _which(cmd)
+                if path:
+                    subprocess.Popen(
+                        [path, url],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True
+                    )
                     return True
-                except FileNotFoundError:
-                    continue
             
-            return True
+            logger.error(f"No URL opener found for {url}")
+            return False
             
         except Exception as e:
             logger.error(f"Failed to open URL {url}: {e}")
@@ -343,29 +449,7 @@ class LinuxAdapter(PlatformAdapter):
     
     def get_default_terminal(self) -> str:
         """Get the default terminal application for Linux."""
-        # Check for common terminal applications
-        terminals = [
-            'gnome-terminal',
-            'konsole',
-            'xfce4-terminal',
-            'terminator',
-            'tilix',
-            'alacritty',
-            'kitty',
-            'xterm'
-        ]
-        
-        for terminal in terminals:
-            try:
-                subprocess.run(['which', terminal], 
-                             check=True, 
-                             stdout=subprocess.DEVNULL)
-                return terminal
-            except subprocess.CalledProcessError:
-                continue
-        
-        # Fallback to xterm
-        return 'xterm'
+        return _find_default_terminal()
     
     def normalize_app_path(self, app_path: str) -> str:
         """Normalize application path for Linux."""
@@ -374,63 +458,202 @@ class LinuxAdapter(PlatformAdapter):
         
         # If it's not an absolute path, try to find it in PATH
         if not path.startswith('/'):
-            try:
-                result = subprocess.run(['which', path], 
-                                      capture_output=True, 
-                                      text=True)
-                if result.returncode == 0:
-                    return result.stdout.strip()
-            except Exception:
-                pass
+            resolved = _which(path)
+            if resolved:
+                return resolved
         
         return path
     
     def _parse_hotkey(self, hotkey: str) -> Optional[str]:
         """Parse hotkey string and convert to pynput format."""
-        # Convert common key names
-        key_mapping = {
-            'ctrl': 'ctrl',
-            'alt': 'alt',
-            'shift': 'shift',
-            'super': 'cmd',  # Super key (Windows key)
-            'meta': 'cmd'
-        }
-        
-        # Split and normalize keys
-        keys = [key.strip().lower() for key in hotkey.split('+')]
-        normalized_keys = []
-        
-        for key in keys:
-            if key in key_mapping:
-                normalized_keys.append(f'<{key_mapping[key]}>')
-            elif len(key) == 1:
-                normalized_keys.append(key)
-            else:
-                # Handle special keys
-                normalized_keys.append(f'<{key}>')
-        
+        keys = (key.strip() for key in hotkey.lower().split('+'))
+        normalized_keys = [
+            _KEY_MAPPING.get(key, key if len(key) == 1 else f'<{key}>')
+            for key in keys
+        ]
         return '+'.join(normalized_keys) if normalized_keys else None
     
-    def _is_window_for_app(self, window_id: str, app_name: str) -> bool:
-        """Check if a window belongs to a specific application."""
+    def _procs(self) -> List[psutil.Process]:
+        """Return running processes with ``info`` populated, reusing a recent scan."""
+        if not self._procs_fresh():
+            self._proc_cache = list(psutil.process_iter(['pid', 'name']))
+            self._proc_cache_ts = time.monotonic()
+        return self._proc_cache
+    
+    def _proc_exe(self, proc: psutil.Process) -> str:
+        """Read a process's executable path, only for processes that need it."""
         try:
-            # Get window PID
-            result = subprocess.run(
-                ['xdotool', 'getwindowpid', window_id],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            return proc.exe() or ""
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return ""
+    
+    def _procs_fresh(self) -> bool:
+        """Check whether the cached process scan is still within its TTL."""
+        return (self._proc_cache is not None
+                and time.monotonic() - self._proc_cache_ts <= PROCESS_CACHE_TTL)
+    
+    def _invalidate_procs(self) -> None:
+        """Drop the cached process scan after launching or killing processes."""
+        self._proc_cache = None
+    
+    def _run_window_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Run a wmctrl/xdotool command and capture its stdout.
+        
+        stderr is discarded, so communicate() only has the stdout pipe to
+        read before reaping the child.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeds WINDOW_COMMAND_TIMEOUT
+        """
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True) as proc:
+            try:
+                stdout, _ = proc.communicate(timeout=WINDOW_COMMAND_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout)
+    
+    def _scan_windows_once(self) -> Optional[Dict[int, List[Tuple[str, str]]]]:
+        """List all windows with a single ``wmctrl -lp`` call.
+        
+        Returns:
+            Mapping of owner PID to (window_id, title) pairs, or None if
+            wmctrl is unavailable or fails
+        """
+        try:
+            result = self._run_window_command(['wmctrl', '-lp'])
+        except Exception as e:
+            logger.debug(f"wmctrl unavailable: {e}")
+            return None
+        
+        if result.returncode != 0:
+            return None
+        
+        windows_by_pid: Dict[int, List[Tuple[str, str]]] = {}
+        for line in result.stdout.splitlines():
+            # Columns: window_id desktop pid host title
+            window_id, _, rest = line.partition(' ')
+            _desktop, _, rest = rest.lstrip().partition(' ')
+            pid, _, rest = rest.lstrip().partition(' ')
+            host, _, title = rest.lstrip().partition(' ')
+            if not host:
+                continue
+            try:
+                pid = int(pid)
+            except ValueError:
+                continue
+            windows_by_pid.setdefault(pid, []).append((window_id, title.lstrip()))
+        
+        return windows_by_pid
+    
+    def _get_window_properties(self, window_id: int,
+                               properties: List[Tuple[str, str]]) -> List[str]:
+        """Read several text properties of a window in one X round-trip.
+        
+        All GetProperty requests are queued before any reply is read, so
+        python-xlib sends them together and collects the replies at once.
+        
+        Args:
+            window_id: X window id
+            properties: (property atom name, type atom name) pairs
             
-            if result.returncode == 0:
-                pid = int(result.stdout.strip())
-                proc = psutil.Process(pid)
-                return app_name.lower() in proc.name().lower()
-                
-        except Exception:
-            pass
+        Returns:
+            Decoded property values, "" for properties that are not set
+        """
+        requests = [
+            self._queue_property_request(window_id, prop, prop_type)
+            for prop, prop_type in properties
+        ]
+        self._display.flush()
+        return [self._read_property_reply(request) for request in requests]
+    
+    def _queue_property_request(self, window_id: int, prop: str, prop_type: str):
+        """Send a GetProperty request without waiting for its reply.
         
-        return False
+        The request is only buffered; call ``self._display.flush()`` once
+        after queueing a batch, then read each reply.
+        """
+        return Xlib.protocol.request.GetProperty(
+            display=self._display.display,
+            defer=True,
+            delete=False,
+            window=window_id,
+            property=self._display.intern_atom(prop),
+            type=self._display.intern_atom(prop_type),
+            long_offset=0,
+            long_length=1024
+        )
+    
+    def _read_property_reply(self, request) -> str:
+        """Wait for a queued GetProperty reply and decode it as text.
+        
+        Raises the X error (e.g. BadWindow) if the request failed.
+        """
+        request.reply()
+        if not request.property_type:
+            return ""
+        _format, value = request.value
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', 'replace')
+        return value if isinstance(value, str) else ""
+    
+    def _tune_display(self) -> None:
+        """Prepare the X connection for many small request/reply exchanges."""
+        # Only TCP displays buffer small writes; Unix sockets need nothing
+        sock = self._display.display.socket
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        # python-xlib caches interned atoms, so later lookups skip the round-trip
+        for atom in _X_ATOMS:
+            self._display.intern_atom(atom)
+    
+    def _send_ewmh_message(self, window_id: str, message_type: str, data: List[int]) -> bool:
+        """Send an EWMH client message for a window to the root window.
+        
+        Args:
+            window_id: Window id as printed by wmctrl (hex) or Xlib (decimal)
+            message_type: Atom name of the message, e.g. _NET_ACTIVE_WINDOW
+            data: Up to five 32-bit data values
+            
+        Returns:
+            True if the message was sent, False if Xlib is unavailable, the
+            window is not managed (e.g. a stale id of a closed window) or
+            sending failed
+        """
+        if not self._display:
+            return False
+        
+        try:
+            root = self._display.screen().root
+            xid = int(window_id, 0)
+            # The root accepts messages for any id, so confirm the window still
+            # exists; otherwise callers fall back to wmctrl, which rejects it
+            client_list = root.get_full_property(
+                self._display.intern_atom('_NET_CLIENT_LIST'),
+                Xlib.X.AnyPropertyType
+            )
+            if client_list is None or xid not in client_list.value:
+                logger.debug(f"EWMH {message_type} skipped, unknown window {window_id}")
+                return False
+            
+            window = self._display.create_resource_object('window', xid)
+            event = Xlib.protocol.event.ClientMessage(
+                window=window,
+                client_type=self._display.intern_atom(message_type),
+                data=(32, (list(data) + [0] * 5)[:5])
+            )
+            root.send_event(
+                event,
+                event_mask=Xlib.X.SubstructureRedirectMask | Xlib.X.SubstructureNotifyMask
+            )
+            self._display.flush()
+            return True
+            
+        except Exception as e:
+            logger.debug(f"EWMH {message_type} failed for window {window_id}: {e}")
+            return False
     
     def _get_windows_xlib(self, app_name: str) -> List[WindowInfo]:
         """Get windows using Xlib as fallback."""
@@ -446,12 +669,22 @@ class LinuxAdapter(PlatformAdapter):
                 Xlib.X.AnyPropertyType
             ).value
             
-            for window_id in window_ids:
+            # Queue every name request first so all replies arrive in one read.
+            # GetProperty takes the raw id, so no Window object is built.
+            # Errors such as BadWindow only surface when a reply is read, so a
+            # window closed mid-scan is skipped by the per-window try below.
+            requests = [
+                (window_id, self._queue_property_request(window_id, 'WM_NAME', 'STRING'))
+                for window_id in window_ids
+            ]
+            self._display.flush()
+            
+            app_name_lower = app_name.lower()
+            for window_id, request in requests:
                 try:
-                    window = self._display.create_resource_object('window', window_id)
-                    window_name = window.get_wm_name()
+                    window_name = self._read_property_reply(request)
                     
-                    if window_name and app_name.lower() in window_name.lower():
+                    if window_name and app_name_lower in window_name.lower():
                         windows.append(WindowInfo(
                             window_id=str(window_id),
                             title=window_name,
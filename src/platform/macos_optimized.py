@@ -7,15 +7,22 @@
 4. 批量操作优化
 5. 异步调用支持
 """
+import functools
+import json
 import os
+import random
+import select
 import subprocess
 import psutil
 import logging
 import time
 import threading
-from typing import List, Dict, Any, Optional, Callable
+import weakref
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Sequence, Set, Tuple
 from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import contextmanager
 
 from .base import PlatformAdapter, WindowInfo, AppInfo
 
@@ -28,29 +35,384 @@ except ImportError:
     Listener = None
 
 try:
+    import objc
     import Quartz
-    from Cocoa import NSWorkspace, NSRunningApplication
+    from Cocoa import (
+        NSBundle, NSURL, NSApplicationActivateIgnoringOtherApps, NSRunningApplication, NSWorkspace,
+        NSWorkspaceLaunchConfigurationArguments, NSWorkspaceLaunchDefault
+    )
     HAS_COCOA = True
 except ImportError:
     HAS_COCOA = False
 
+try:
+    from ApplicationServices import (
+        AXIsProcessTrusted, AXUIElementCreateApplication, AXUIElementCopyAttributeValue,
+        AXUIElementPerformAction, AXUIElementSetAttributeValue, AXValueGetValue,
+        kAXErrorSuccess, kAXWindowsAttribute, kAXTitleAttribute, kAXPositionAttribute,
+        kAXSizeAttribute, kAXMinimizedAttribute, kAXCloseButtonAttribute,
+        kAXRaiseAction, kAXPressAction, kAXValueCGPointType, kAXValueCGSizeType
+    )
+    HAS_AX = True
+except ImportError:
+    HAS_AX = False
+
+# 私有API _AXUIElementGetWindow：直接取得AX窗口元素对应的CGWindowID，系统不提供时为None
+_AXUIElementGetWindow = None
+if HAS_AX and HAS_COCOA:
+    try:
+        _hi_services: Dict[str, Any] = {}
+        objc.loadBundleFunctions(
+            NSBundle.bundleWithIdentifier_('com.apple.HIServices'), _hi_services,
+            [('_AXUIElementGetWindow', b'i^{__AXUIElement=}o^I')]
+        )
+        _AXUIElementGetWindow = _hi_services.get('_AXUIElementGetWindow')
+    except Exception:
+        pass
+
+try:
+    from ApplicationServices import (
+        AXObserverCreate, AXObserverAddNotification, AXObserverGetRunLoopSource,
+        kAXErrorNotificationAlreadyRegistered
+    )
+    from CoreFoundation import (
+        CFRunLoopGetCurrent, CFRunLoopAddSource, CFRunLoopRemoveSource, CFRunLoopRunInMode,
+        CFRunLoopStop, kCFRunLoopDefaultMode, kCFRunLoopRunFinished
+    )
+    HAS_AX_OBSERVER = True
+except ImportError:
+    HAS_AX_OBSERVER = False
+
 logger = logging.getLogger(__name__)
 
+# 修饰键名称到pynput热键格式的映射
+_KEY_MAPPING = {
+    'cmd': '<cmd>', 'ctrl': '<ctrl>', 'alt': '<alt>', 'shift': '<shift>',
+    'option': '<alt>', 'command': '<cmd>'
+}
+
+# 按顺序查找.app的目录
+APP_SEARCH_PATHS = ('/Applications', '/System/Applications', '~/Applications')
+
+# 同一热键两次触发的默认最小间隔(秒)
+HOTKEY_DEBOUNCE_INTERVAL = 0.15
+
+# Quartz窗口信息字典的键
+CG_WINDOW_OWNER_NAME = 'kCGWindowOwnerName'
+CG_WINDOW_NUMBER = 'kCGWindowNumber'
+CG_WINDOW_NAME = 'kCGWindowName'
+
+# Quartz窗口列表快照的共享时间(秒)
+CG_SNAPSHOT_TTL = 0.25
+
+# 运行中应用列表的缓存时间(秒)
+RUNNING_APPS_CACHE_TTL = 1.0
+
+# 激活窗口后直接作为活动窗口返回的有效时间(秒)
+LAST_ACTIVATED_TTL = 0.2
+
+# 窗口缓存的自适应有效期(秒)：窗口常被操作的应用缩短，长期稳定的应用延长
+WINDOW_CACHE_TTL_MIN = 0.2
+WINDOW_CACHE_TTL_MAX = 3.0
+WINDOW_CACHE_GROW_HITS = 5  # 连续命中这么多次且未失效时延长有效期
+
+# 每个缓存项的有效期按此比例随机浮动，避免同时写入的缓存同时过期、集中重新查询
+WINDOW_CACHE_TTL_JITTER = 0.3
+
+# 已注册AXObserver的应用由窗口变化通知使缓存失效，TTL只作兜底；
+# 只用于AppleScript获取的窗口列表。Quartz屏幕窗口列表在切换桌面、隐藏/显示应用时也会变化，
+# 这些情况没有窗口通知，仍按自适应有效期过期
+WINDOW_CACHE_TTL_OBSERVED = 60.0
+
+# 注册在应用元素上的辅助功能通知：新窗口出现
+_AX_APP_NOTIFICATIONS = ('AXWindowCreated',)
+
+# 窗口关闭、改名、最小化/还原只在注册到每个窗口元素上时才能可靠收到
+_AX_WINDOW_NOTIFICATIONS = (
+    'AXUIElementDestroyed', 'AXTitleChanged',
+    'AXWindowMiniaturized', 'AXWindowDeminiaturized',
+)
+
+# 窗口缓存最多保存的应用数，超出时淘汰最久未写入的应用
+WINDOW_CACHE_MAXSIZE = 32
+
+# 批量AppleScript输出中的字段分隔符
+WINDOW_FIELD_SEP = "§"
+
+# 窗口操作AppleScript，参数通过 on run argv 传入，源码固定，便于复用编译结果并避免注入
+# 参数为窗口ID和所属应用名；按 window id 直接引用窗口，不使用逐个过滤的 whose 查询
+# 激活脚本成功时一并返回窗口标题，激活后无需再查询一次活动窗口
+_ACTIVATE_ITERM_WINDOW_SCRIPT = f'''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "iTerm2"
+        activate
+        try
+            select window id windowID
+            return "success{WINDOW_FIELD_SEP}" & (name of window id windowID)
+        on error errMsg
+            return "error:" & errMsg
+        end try
+    end tell
+end run
+'''
+
+_ACTIVATE_WINDOW_SCRIPT = f'''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        try
+            set theWindow to window id windowID of process (item 2 of argv)
+            perform action "AXRaise" of theWindow
+            return "success{WINDOW_FIELD_SEP}" & (name of theWindow)
+        on error errMsg
+            return "error:" & errMsg
+        end try
+    end tell
+end run
+'''
+
+# 最小化/关闭脚本不返回内容，失败时直接抛出错误，调用方只看退出码
+_MINIMIZE_WINDOW_SCRIPT = '''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        set minimized of window id windowID of process (item 2 of argv) to true
+    end tell
+end run
+'''
+
+_CLOSE_WINDOW_SCRIPT = '''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        perform action "AXCancel" of window id windowID of process (item 2 of argv)
+    end tell
+end run
+'''
+
+# 无法确定所属应用时(例如窗口已最小化或位于其他桌面、且不在缓存中)使用的后备脚本，
+# 参数只有窗口ID，由System Events在全部窗口中查找
+_ACTIVATE_ANY_WINDOW_SCRIPT = f'''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        try
+            set theWindow to (first window whose id is windowID)
+            perform action "AXRaise" of theWindow
+            return "success{WINDOW_FIELD_SEP}" & (name of theWindow)
+        on error errMsg
+            return "error:" & errMsg
+        end try
+    end tell
+end run
+'''
+
+_MINIMIZE_ANY_WINDOW_SCRIPT = '''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        set minimized of (first window whose id is windowID) to true
+    end tell
+end run
+'''
+
+_CLOSE_ANY_WINDOW_SCRIPT = '''
+on run argv
+    set windowID to (item 1 of argv) as integer
+    tell application "System Events"
+        perform action "AXCancel" of (first window whose id is windowID)
+    end tell
+end run
+'''
+
+# 按名称逐个获取指定应用的窗口，未运行的应用跳过
+_APP_WINDOWS_SCRIPT = f'''
+on run argv
+    set out to ""
+    tell application "System Events"
+        repeat with appName in argv
+            try
+                repeat with w in (every window of process (appName as text))
+                    set out to out & appName & "{WINDOW_FIELD_SEP}" & (id of w) & "{WINDOW_FIELD_SEP}" & (name of w) & linefeed
+                end repeat
+            end try
+        end repeat
+    end tell
+    return out
+end run
+'''
+
+# 前台进程只查找一次；标题放在最后，其中出现分隔符也不影响解析
+_ACTIVE_WINDOW_SCRIPT = f'''
+tell application "System Events"
+    try
+        set frontProc to first application process whose frontmost is true
+        set frontWindow to window 1 of frontProc
+        return ((id of frontWindow) as string) & "{WINDOW_FIELD_SEP}" & (name of frontProc) & "{WINDOW_FIELD_SEP}" & (name of frontWindow)
+    on error
+        return ""
+    end try
+end tell
+'''
+
+_QUIT_APP_SCRIPT = '''
+on run argv
+    tell application (item 1 of argv) to quit
+end run
+'''
+
+# 系统命令使用绝对路径：可执行文件带目录且不指定cwd、close_fds=False时，
+# CPython才会用posix_spawn代替fork+exec创建子进程
+OSASCRIPT_PATH = '/usr/bin/osascript'
+OPEN_PATH = '/usr/bin/open'
+PS_PATH = '/bin/ps'
+KILLALL_PATH = '/usr/bin/killall'
+
+# 常驻osascript进程启动所需的额外等待时间(秒)
+OSA_STARTUP_TIMEOUT = 2.0
+
+# 常驻osascript进程缓存的已编译脚本数量上限
+OSA_COMPILED_CACHE_SIZE = 64
+
+# 常驻osascript进程(JXA)：逐行读取JSON编码的AppleScript及参数，执行后逐行输出JSON结果
+# 脚本按源码缓存编译结果(NSAppleScript)，重复执行时跳过词法/语法分析
+_OSA_SERVER_JS = """
+ObjC.import('Foundation');
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+function reply(obj) {
+    stdout.writeData($(JSON.stringify(obj) + '\\n').dataUsingEncoding($.NSUTF8StringEncoding));
+}
+var compiled = {};
+var compiledCount = 0;
+function runAppleScript(src, args) {
+    var script = compiled[src];
+    if (!script) {
+        script = $.NSAppleScript.alloc.initWithSource($(src));
+        var compileError = Ref();
+        if (!script.compileAndReturnError(compileError)) {
+            throw new Error(JSON.stringify(ObjC.deepUnwrap(compileError[0])));
+        }
+        if (compiledCount >= %(cache_size)d) {
+            compiled = {};
+            compiledCount = 0;
+        }
+        compiled[src] = script;
+        compiledCount++;
+    }
+    var error = Ref();
+    var result;
+    if (args.length) {
+        // 以带参数的打开事件调用 on run argv 处理器，与 osascript 传参方式一致
+        var event = $.NSAppleEventDescriptor.appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+            0x61657674, 0x6f617070, $.NSAppleEventDescriptor.nullDescriptor, -1, 0);
+        var argv = $.NSAppleEventDescriptor.listDescriptor;
+        for (var i = 0; i < args.length; i++) {
+            argv.insertDescriptorAtIndex($.NSAppleEventDescriptor.descriptorWithString($(args[i])), i + 1);
+        }
+        event.setParamDescriptorForKeyword(argv, 0x2d2d2d2d);
+        result = script.executeAppleEventError(event, error);
+    } else {
+        result = script.executeAndReturnError(error);
+    }
+    if (result.isNil()) {
+        throw new Error(JSON.stringify(ObjC.deepUnwrap(error[0])));
+    }
+    var text = result.stringValue;
+    return text.isNil() ? '' : text.js;
+}
+var buf = '';
+while (true) {
+    var data = stdin.availableData;
+    if (data.length == 0) break;
+    buf += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var idx;
+    while ((idx = buf.indexOf('\\n')) >= 0) {
+        var line = buf.slice(0, idx);
+        buf = buf.slice(idx + 1);
+        try {
+            var request = JSON.parse(line);
+            reply({ok: true, out: runAppleScript(request.src, request.args)});
+        } catch (e) {
+            reply({ok: false, err: String(e)});
+        }
+    }
+}
+""" % {'cache_size': OSA_COMPILED_CACHE_SIZE}
+
+
+@functools.lru_cache(maxsize=1)
+def _find_default_terminal() -> str:
+    """查找已安装的终端，进程生命周期内结果不变，只检查一次"""
+    terminals = [
+        "/Applications/iTerm.app",
+        "/Applications/Terminal.app",
+        "/System/Applications/Terminal.app"
+    ]
+    
+    for terminal in terminals:
+        if os.path.exists(terminal):
+            return terminal
+    
+    return "Terminal"
+
 
 class OptimizedMacOSAdapter(PlatformAdapter):
     """优化版macOS平台适配器"""
     
-    def __init__(self):
+    def __init__(self, hotkey_debounce: float = HOTKEY_DEBOUNCE_INTERVAL,
+                 window_cache_maxsize: int = WINDOW_CACHE_MAXSIZE):
         self._hotkey_listeners = {}
+        self._hotkey_debounce = hotkey_debounce  # 同一热键两次触发的最小间隔(秒)
         self._running_listener = None
         
         # 性能优化：缓存机制
-        self._window_cache: Dict[str, List[WindowInfo]] = {}
-        self._cache_timestamps: Dict[str, float] = {}
-        self._cache_timeout = 1.0  # 1秒缓存超时
+        # 应用名 -> (写入时间, 窗口列表, 有效期系数, 是否来自Quartz屏幕窗口列表)，
+        # 整项替换，读取时只需一次查找；按写入顺序淘汰
+        self._window_cache: 'OrderedDict[str, Tuple[float, List[WindowInfo], float, bool]]' = OrderedDict()
+        self._window_cache_maxsize = window_cache_maxsize
+        # 窗口缓存及其有效期/命中计数的所有修改都持有此锁：查询线程和AX通知线程会同时修改
+        self._cache_lock = threading.Lock()
+        # 每个应用一把锁：同一应用并发未命中时只有一个线程真正查询，其余线程等待后读取缓存
+        # 弱引用保存：没有线程持有或等待时锁被回收，字典不会随查询过的应用名无限增长
+        self._key_locks: 'weakref.WeakValueDictionary[str, threading.Lock]' = weakref.WeakValueDictionary()
+        self._key_locks_guard = threading.Lock()
+        
+        # 窗口变化通知：应用名 -> (进程ID, AXObserver)，在后台线程的run loop上接收
+        self._ax_observers: Dict[str, Tuple[int, Any]] = {}
+        self._ax_observers_lock = threading.Lock()
+        # 待注册的应用：查询线程只入队，注册(跨进程的辅助功能调用)在后台run loop线程中进行
+        self._ax_queue: 'deque[str]' = deque()
+        self._ax_pending: Set[str] = set()
+        # 注册失败的应用(不支持辅助功能、未授权等)，不再重试，继续按TTL过期
+        self._ax_failed: Set[str] = set()
+        self._ax_runloop = None
+        self._ax_thread: Optional[threading.Thread] = None
+        self._ax_wakeup = threading.Event()
+        self._ax_stopping = False
+        self._cache_timeout = 1.0  # 1秒缓存超时，各应用的初始有效期
+        self._cache_ttl: Dict[str, float] = {}  # 应用名 -> 当前有效期
+        self._cache_hits: Dict[str, int] = {}  # 应用名 -> 上次失效以来的连续命中数
+        self._cg_snapshot: Optional[Tuple[float, list]] = None
+        self._cg_window_index: Dict[str, Any] = {}
+        self._cg_owner_index: Dict[str, list] = {}
+        self._oneshot_local = threading.local()  # 每个线程的oneshot()嵌套深度，块内快照不按TTL过期
+        self._last_activated: Optional[Tuple[float, WindowInfo]] = None  # 最近一次成功激活的窗口
+        self._apps_cache: Optional[List[AppInfo]] = None
+        self._apps_cache_ts = 0.0
+        self._apps_name_index: Set[str] = set()
+        self._app_index: Optional[Dict[str, str]] = None
+        
+        # NSWorkspace单例只取一次，避免每次查询都经过ObjC消息派发
+        self._workspace = NSWorkspace.sharedWorkspace() if HAS_COCOA else None
         
-        # 性能优化：线程池用于并发操作
-        self._thread_pool = ThreadPoolExecutor(max_workers=3)
+        # 辅助功能权限检查结果，仅缓存已授权的情况
+        self._accessibility_trusted = False
+        
+        # 性能优化：常驻osascript进程，首次使用时启动
+        self._osa_proc: Optional[subprocess.Popen] = None
+        self._osa_lock = threading.Lock()
         
         logger.info("初始化优化版macOS适配器，启用缓存和并发优化")
     
@@ -62,22 +424,43 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         try:
             normalized_path = self.normalize_app_path(app_path)
             
+            # 优化：.app 通过LaunchServices进程内启动，无需fork /usr/bin/open
+            if HAS_COCOA and normalized_path.endswith('.app') and os.path.isabs(normalized_path):
+                logger.info("【launch_app】启动应用: %s, 参数: %s", app_path, args)
+                app, error = self._workspace.launchApplicationAtURL_options_configuration_error_(
+                    NSURL.fileURLWithPath_(normalized_path),
+                    NSWorkspaceLaunchDefault,
+                    {NSWorkspaceLaunchConfigurationArguments: list(args or [])},
+                    None
+                )
+                if app is not None:
+                    self._invalidate_apps_cache()
+                    return True
+                logger.warning(f"LaunchServices启动失败，改用open命令: {error}")
+            
             if normalized_path.endswith('.app'):
-                cmd = ['open', '-a', normalized_path]
+                cmd = [OPEN_PATH, '-a', normalized_path]
                 if args:
                     cmd.extend(['--args'] + args)
+                # 应用由LaunchServices启动，不继承open的工作目录，无需设置cwd
+                popen_cwd = None
             else:
                 cmd = [normalized_path]
                 if args:
                     cmd.extend(args)
+                popen_cwd = cwd or os.path.expanduser('~')
             
             logger.info(f"【launch_app】启动应用: {app_path}, 参数: {args}, 工作目录: {cwd}, 命令: {cmd}")
+            # Python打开的文件描述符默认不可继承，无需在子进程中逐个关闭；
+            # close_fds=False 省去这一步，配合绝对路径且不设cwd时CPython改用posix_spawn
             subprocess.Popen(
                 cmd,
-                cwd=cwd or os.path.expanduser('~'),
+                cwd=popen_cwd,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=False
             )
+            self._invalidate_apps_cache()
             return True
             
         except Exception as e:
@@ -89,13 +472,21 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         打开网站URL
         """
         try:
-            cmd = ['open', '-u', url]
+            # 优化：通过LaunchServices进程内打开，无需fork /usr/bin/open
+            if HAS_COCOA:
+                ns_url = NSURL.URLWithString_(url)
+                if ns_url is not None and self._workspace.openURL_(ns_url):
+                    logger.info("【open_url】打开网站: %s", url)
+                    return True
+            
+            cmd = [OPEN_PATH, '-u', url]
             
             logger.info(f"【open_url】打开网站: {url}, 命令: {cmd}")
             subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=False
             )
             return True
             
@@ -106,41 +497,63 @@ class OptimizedMacOSAdapter(PlatformAdapter):
     def get_running_apps(self, app_name: Optional[str] = None) -> List[AppInfo]:
         """
         获取运行中的应用程序
-        优化：优先使用Cocoa API，性能更好
+        优化1：短时缓存，运行中的应用以秒级变化，热路径重复查询直接返回缓存
+        优化2：优先使用Cocoa API，性能更好
+        优化3：传入bundle ID时直接按ID查询，不枚举全部应用
         """
+        if HAS_COCOA and app_name and self._is_bundle_id(app_name):
+            with objc.autorelease_pool():
+                matched = NSRunningApplication.runningApplicationsWithBundleIdentifier_(app_name)
+                if matched.count() > 0:
+                    return [self._app_info_from_ns(app) for app in matched]
+        
+        apps = self._get_running_apps_cached()
+        
+        if not app_name:
+            return list(apps)
+        
+        app_name_lower = app_name.lower()
+        return [app for app in apps if app_name_lower in app.name.lower()]
+    
+    def _get_running_apps_cached(self) -> List[AppInfo]:
+        """返回缓存的运行应用列表，过期时重新枚举并重建名称索引"""
+        current_time = time.monotonic()
+        # 只读一次并返回局部变量：其他线程可能随时把缓存清为None
+        apps = self._apps_cache
+        if apps is None or (not self._oneshot_active
+                            and current_time - self._apps_cache_ts >= RUNNING_APPS_CACHE_TTL):
+            apps = self._list_running_apps()
+            self._apps_name_index = {app.name.lower() for app in apps}
+            self._apps_cache_ts = current_time
+            self._apps_cache = apps
+        return apps
+    
+    def _list_running_apps(self) -> List[AppInfo]:
+        """枚举全部运行中的应用，不做过滤"""
         apps = []
         
         try:
             if HAS_COCOA:
-                # 优化：使用Cocoa API，比psutil更快
-                workspace = NSWorkspace.sharedWorkspace()
-                running_apps = workspace.runningApplications()
-                
-                for app in running_apps:
-                    if app.activationPolicy() == 0:  # 只获取常规应用
-                        name = str(app.localizedName())
-                        if app_name and app_name.lower() not in name.lower():
-                            continue
-                        
-                        app_info = AppInfo(
-                            pid=app.processIdentifier(),
-                            name=name,
-                            executable_path=str(app.executableURL().path()) if app.executableURL() else "",
-                            windows=[]  # 延迟加载窗口信息
-                        )
-                        apps.append(app_info)
+                with objc.autorelease_pool():
+                    # 优化：使用Cocoa API，比psutil更快
+                    running_apps = self._workspace.runningApplications()
+                    
+                    for app in running_apps:
+                        if app.activationPolicy() == 0:  # 只获取常规应用
+                            apps.append(self._app_info_from_ns(app))
             else:
-                # 后备方案：使用psutil
+                # 后备方案：一次ps管道取得全部进程名，比psutil逐进程sysctl更快
+                apps = self._list_processes_ps()
+                if apps is not None:
+                    return apps
+                
+                apps = []
                 for proc in psutil.process_iter(['pid', 'name', 'exe']):
                     try:
                         proc_info = proc.info
-                        name = proc_info['name']
-                        if app_name and app_name.lower() not in name.lower():
-                            continue
-                        
                         app_info = AppInfo(
                             pid=proc_info['pid'],
-                            name=name,
+                            name=proc_info['name'] or "",
                             executable_path=proc_info['exe'] or "",
                             windows=[]
                         )
@@ -153,6 +566,57 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         
         return apps
     
+    @staticmethod
+    def _app_info_from_ns(app) -> AppInfo:
+        """把NSRunningApplication转换为AppInfo"""
+        executable_url = app.executableURL()
+        return AppInfo(
+            pid=app.processIdentifier(),
+            name=str(app.localizedName()),
+            executable_path=str(executable_url.path()) if executable_url else "",
+            windows=[]  # 延迟加载窗口信息
+        )
+    
+    @staticmethod
+    def _is_bundle_id(app_name: str) -> bool:
+        """粗略判断是否为bundle ID(如 com.apple.Terminal)"""
+        return '.' in app_name and ' ' not in app_name
+    
+    def _list_processes_ps(self) -> Optional[List[AppInfo]]:
+        """通过 ps -Axco pid,comm 列出全部进程，失败时返回None"""
+        try:
+            result = subprocess.run(
+                [PS_PATH, '-Axco', 'pid,comm'],
+                capture_output=True,
+                text=True,
+                timeout=2,
+                close_fds=False
+            )
+        except Exception as e:
+            logger.debug(f"ps获取进程列表失败: {e}")
+            return None
+        
+        if result.returncode != 0:
+            return None
+        
+        apps = []
+        for line in result.stdout.splitlines()[1:]:  # 跳过表头
+            pid, _, comm = line.strip().partition(' ')
+            try:
+                apps.append(AppInfo(
+                    pid=int(pid),
+                    name=comm.strip(),
+                    executable_path="",
+                    windows=[]
+                ))
+            except ValueError:
+                continue
+        return apps
+    
+    def _invalidate_apps_cache(self):
+        """启动或终止应用后清除运行应用缓存"""
+        self._apps_cache = None
+    
     def get_app_windows(self, app_name: str) -> List[WindowInfo]:
         """
         获取应用程序窗口信息
@@ -163,22 +627,39 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         current_time = time.time()
         
         # 优化：检查缓存
-        if self._is_cache_valid(app_name, current_time):
+        cached = self._get_cached_windows(app_name, current_time)
+        if cached is not None:
             logger.debug(f"从缓存返回 {app_name} 的窗口信息")
-            return self._window_cache[app_name]
-        
-        # 优化：优先尝试Cocoa API
-        if HAS_COCOA:
-            windows = self._get_windows_cocoa(app_name)
-            if windows:
-                self._update_cache(app_name, windows, current_time)
-                return windows
+            return cached
         
-        # 后备方案：优化的AppleScript
-        windows = self._get_windows_applescript_optimized(app_name)
-        self._update_cache(app_name, windows, current_time)
-        
-        return windows
+        with self._key_lock(app_name):
+            # 等锁期间其他线程可能已写入缓存，再检查一次
+            cached = self._get_cached_windows(app_name, time.time())
+            if cached is not None:
+                logger.debug(f"从缓存返回 {app_name} 的窗口信息")
+                return cached
+            
+            # 优化：优先尝试Cocoa API
+            if HAS_COCOA:
+                windows = self._get_windows_cocoa(app_name)
+                if windows:
+                    self._update_cache(app_name, windows, current_time, on_screen=True)
+                    return windows
+            
+            # 后备方案：屏幕窗口列表中没有该应用(窗口全部最小化、位于其他桌面或名称不一致)，
+            # 只用AppleScript查询这一个应用，不遍历全部进程；同一应用的并发查询已由上面的锁合并
+            windows = self._get_all_windows_applescript([app_name]).get(app_name, [])
+            self._update_cache(app_name, windows, current_time)
+            
+            return windows
+    
+    def _key_lock(self, app_name: str) -> threading.Lock:
+        """返回指定应用的查询锁，不存在时创建；调用方持有返回值期间锁不会被回收"""
+        with self._key_locks_guard:
+            lock = self._key_locks.get(app_name)
+            if lock is None:
+                lock = self._key_locks[app_name] = threading.Lock()
+            return lock
     
     def _get_windows_cocoa(self, app_name: str) -> List[WindowInfo]:
         """
@@ -186,114 +667,117 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         优化：比AppleScript快5-10倍
         """
         try:
-            # 获取所有窗口
-            window_list = Quartz.CGWindowListCopyWindowInfo(
-                Quartz.kCGWindowListOptionOnScreenOnly, 
-                Quartz.kCGNullWindowID
-            )
+            windows = list(self._iter_windows_cocoa(app_name))
             
-            windows = []
-            all_apps = set()  # 收集所有应用名称用于调试
+            # 调试日志：如果没有找到窗口，显示所有终端类应用名称(仅在未找到时收集)
+            if not windows:
+                terminal_apps = {
+                    owner for owner in self._cg_owner_index
+                    if owner and ('iterm' in owner.lower() or 'terminal' in owner.lower())
+                }
+                if terminal_apps:
+                    logger.info(f"调试: 查找 '{app_name}' 时未找到窗口，但发现终端类应用: {list(terminal_apps)}")
             
-            for window in window_list:
-                owner_name = window.get('kCGWindowOwnerName', '')
-                all_apps.add(owner_name)
-                
-                if owner_name == app_name:
-                    window_id = str(window.get('kCGWindowNumber', 0))
-                    title = window.get('kCGWindowName', '')
-                    
-                    # 对于终端应用，即使没有标题也要包含窗口
-                    # 使用默认标题或窗口ID作为标识
-                    if not title:
-                        if 'iterm' in app_name.lower() or 'terminal' in app_name.lower():
-                            title = f"Terminal Window {window_id}"
-                        else:
-                            title = f"Untitled Window {window_id}"
-                    
-                    # 只过滤掉明显无效的窗口（窗口ID为0）
-                    if window_id and window_id != '0':
-                        windows.append(WindowInfo(
-                            window_id=window_id,
-                            title=title,
-                            app_name=app_name,
-                            is_active=False,  # Cocoa API需要额外调用来确定
-                            is_minimized=False
-                        ))
-                        logger.debug(f"添加窗口: {window_id} - '{title}'")
-                    else:
-                        logger.debug(f"跳过无效窗口: {window_id}")
-            
-            # 调试日志：如果没有找到窗口，显示所有应用名称
-            if not windows and any('iterm' in app.lower() or 'terminal' in app.lower() for app in all_apps):
-                terminal_apps = [app for app in all_apps if 'iterm' in app.lower() or 'terminal' in app.lower()]
-                logger.info(f"调试: 查找 '{app_name}' 时未找到窗口，但发现终端类应用: {terminal_apps}")
-            
-            logger.debug(f"通过Cocoa API获取到 {len(windows)} 个窗口")
+            logger.debug("通过Cocoa API获取到 %d 个窗口", len(windows))
             return windows
             
         except Exception as e:
             logger.warning(f"Cocoa API获取窗口失败: {e}")
             return []
     
-    def _get_windows_applescript_optimized(self, app_name: str) -> List[WindowInfo]:
+    def _iter_windows_cocoa(self, app_name: str) -> Iterator[WindowInfo]:
         """
-        优化的AppleScript窗口获取
-        优化1：减少超时时间 (5s -> 0.5s)
-        优化2：简化脚本逻辑
-        优化3：更好的错误处理
+        逐个生成应用的窗口，由调用方决定是否构建列表
+        优化：直接取快照中按应用分组的窗口，只转换匹配的窗口
         """
-        windows = []
+        return self._iter_windows_from_cg(app_name, self._cg_windows_by_owner().get(app_name, ()))
+    
+    def _iter_windows_from_cg(self, app_name: str, matching: Iterable[Any]) -> Iterator[WindowInfo]:
+        """把同一应用的CGWindow字典逐个转换为WindowInfo"""
+        app_name_lower = app_name.lower()
+        is_terminal = 'iterm' in app_name_lower or 'terminal' in app_name_lower
+        
+        for window in matching:
+            window_id = str(window.get(CG_WINDOW_NUMBER, 0))
+            title = window.get(CG_WINDOW_NAME, '')
+            
+            # 对于终端应用，即使没有标题也要包含窗口
+            # 使用默认标题或窗口ID作为标识
+            if not title:
+                if is_terminal:
+                    title = f"Terminal Window {window_id}"
+                else:
+                    title = f"Untitled Window {window_id}"
+            
+            # 只过滤掉明显无效的窗口（窗口ID为0）
+            if window_id and window_id != '0':
+                logger.debug("添加窗口: %s - '%s'", window_id, title)
+                yield WindowInfo(
+                    window_id=window_id,
+                    title=title,
+                    app_name=app_name,
+                    is_active=False,  # Cocoa API需要额外调用来确定
+                    is_minimized=False
+                )
+            else:
+                logger.debug("跳过无效窗口: %s", window_id)
+    
+    def _get_all_windows_applescript(self, app_names: Optional[Sequence[str]] = None) -> Dict[str, List[WindowInfo]]:
+        """
+        一次AppleScript获取所有前台应用(或指定应用)的窗口
+        优化：N个应用只启动一次osascript，避免逐个应用fork/编译脚本
+        """
+        windows_by_app: Dict[str, List[WindowInfo]] = {}
         
         try:
-            # 优化：简化的AppleScript，减少循环复杂度
-            script = f'''
+            # 用少见的分隔符，避免与窗口标题中的字符冲突
+            all_apps_script = f'''
             tell application "System Events"
-                try
-                    set appProcess to first process whose name is "{app_name}"
-                    set windowList to windows of appProcess
-                    set result to ""
-                    repeat with w in windowList
-                        set result to result & (id of w) & "|" & (name of w) & "\\n"
-                    end repeat
-                    return result
-                on error
-                    return ""
-                end try
+                set out to ""
+                repeat with p in (every process whose background only is false)
+                    set appName to name of p
+                    try
+                        repeat with w in (every window of p)
+                            set out to out & appName & "{WINDOW_FIELD_SEP}" & (id of w) & "{WINDOW_FIELD_SEP}" & (name of w) & linefeed
+                        end repeat
+                    end try
+                end repeat
+                return out
             end tell
             '''
             
             start_time = time.time()
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=0.5  # 优化：从5秒减少到0.5秒
-            )
+            if app_names:
+                # 只遍历指定应用，应用名通过argv传入，脚本源码固定
+                result = self._osa_run(_APP_WINDOWS_SCRIPT, timeout=0.5 + 0.1 * len(app_names),
+                                       args=list(app_names))
+            else:
+                result = self._osa_run(all_apps_script, timeout=2.0)  # 一次遍历所有应用，超时比单应用查询长
             execution_time = (time.time() - start_time) * 1000
             
-            logger.debug(f"AppleScript执行时间: {execution_time:.2f}ms")
+            logger.debug(f"AppleScript批量获取窗口耗时: {execution_time:.2f}ms")
             
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().split('\\n'):
-                    if '|' in line:
-                        parts = line.split('|', 1)
-                        if len(parts) == 2:
-                            window_id, title = parts
-                            windows.append(WindowInfo(
-                                window_id=window_id.strip(),
-                                title=title.strip(),
-                                app_name=app_name,
-                                is_active=False,
-                                is_minimized=False
-                            ))
-                            
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    # partition不创建中间列表，缺少分隔符的行直接跳过
+                    app_name, _, rest = line.partition(WINDOW_FIELD_SEP)
+                    window_id, sep, title = rest.partition(WINDOW_FIELD_SEP)
+                    if not sep:
+                        continue
+                    windows_by_app.setdefault(app_name, []).append(WindowInfo(
+                        window_id=window_id.strip(),
+                        title=title.strip(),
+                        app_name=app_name,
+                        is_active=False,
+                        is_minimized=False
+                    ))
+                        
         except subprocess.TimeoutExpired:
-            logger.warning(f"AppleScript超时获取 {app_name} 窗口")
+            logger.warning("AppleScript批量获取窗口超时")
         except Exception as e:
-            logger.error(f"AppleScript获取窗口失败 {app_name}: {e}")
+            logger.error(f"AppleScript批量获取窗口失败: {e}")
         
-        return windows
+        return windows_by_app
     
     # todo这个方法比较慢，接近300ms，按t终端切换时会调用，后续考虑优化为按c切换应用一样的逻辑
     def activate_window(self, window_id: str) -> bool:
@@ -302,58 +786,44 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         优化：减少超时时间，添加快速失败机制
         """
         try:
-            # 首先尝试找到窗口所属的应用
-            window_info = self.find_window_by_id_fast(window_id)
-            
-            # 针对 iTerm2 使用专门的激活脚本
-            if window_info and 'iterm' in window_info.app_name.lower():
-                script = f'''
-                tell application "iTerm2"
-                    activate
-                    try
-                        repeat with theWindow in windows
-                            if id of theWindow is {window_id} then
-                                select theWindow
-                                return "success"
-                            end if
-                        end repeat
-                        return "notfound"
-                    on error errMsg
-                        return "error:" & errMsg
-                    end try
-                end tell
-                '''
+            if not self._is_window_id(window_id):
+                return False
+            
+            # 首先找到窗口所属的应用，脚本直接定位到该应用的窗口
+            owner = self._window_owner(window_id)
+            
+            # 优化：辅助功能API在进程内直接操作窗口，无需osascript
+            ax = self._ax_window(window_id)
+            if ax is not None and self._ax_raise(ax[0], ax[1]):
+                self._remember_activated(window_id, owner, ax[2])
+                return True
+            
+            # 后备方案：针对 iTerm2 使用专门的激活脚本，其他应用使用 System Events；
+            # 找不到所属应用时在全部窗口中查找
+            is_iterm = owner is not None and 'iterm' in owner.lower()
+            if owner is None:
+                script, args = _ACTIVATE_ANY_WINDOW_SCRIPT, [window_id]
             else:
-                # 对于其他应用，使用 System Events
-                script = f'''
-                tell application "System Events"
-                    try
-                        perform action "AXRaise" of (first window whose id is {window_id})
-                        return "success"
-                    on error errMsg
-                        return "error:" & errMsg
-                    end try
-                end tell
-                '''
+                script = _ACTIVATE_ITERM_WINDOW_SCRIPT if is_iterm else _ACTIVATE_WINDOW_SCRIPT
+                args = [window_id, owner]
             
             start_time = time.time()
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=2.0 if window_info and 'iterm' in window_info.app_name.lower() else 0.5  # iTerm2 需要更多时间
+            result = self._osa_run(
+                script,
+                timeout=2.0 if is_iterm else 0.5,  # iTerm2 需要更多时间
+                args=args
             )
             execution_time = (time.time() - start_time) * 1000
             
             logger.debug(f"窗口激活耗时: {execution_time:.2f}ms")
             
             # 检查激活结果
-            success = result.returncode == 0 and 'success' in result.stdout
+            # 标题紧跟在状态之后，只看开头，避免标题中的文字干扰判断
+            success = result.returncode == 0 and result.stdout.startswith('success')
             
             if success:
-                logger.info(f"成功激活窗口 {window_id}")
-                # 清除缓存，因为窗口状态可能改变
-                self._clear_cache()
+                _, _, title = result.stdout.strip().partition(WINDOW_FIELD_SEP)
+                self._remember_activated(window_id, owner, title)
             else:
                 # 详细的错误日志
                 if 'notfound' in result.stdout:
@@ -373,15 +843,46 @@ class OptimizedMacOSAdapter(PlatformAdapter):
             logger.error(f"激活窗口失败 {window_id}: {e}")
             return False
     
+    def _remember_activated(self, window_id: str, owner: Optional[str], title: str):
+        """记录激活成功的窗口，供随后的get_active_window直接返回"""
+        logger.info(f"成功激活窗口 {window_id}")
+        # 窗口状态可能改变，只让所属应用的缓存失效
+        self._invalidate_app(owner)
+        if owner is None:
+            return
+        self._last_activated = (time.monotonic(), WindowInfo(
+            window_id=window_id,
+            title=title,
+            app_name=owner,
+            is_active=True,
+            is_minimized=False
+        ))
+    
+    def _ax_raise(self, pid: int, ax_window) -> bool:
+        """提升窗口并把所属应用切到前台"""
+        with objc.autorelease_pool():
+            if AXUIElementPerformAction(ax_window, kAXRaiseAction) != kAXErrorSuccess:
+                return False
+            app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+            return app is not None and bool(app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps))
+    
     def activate_window_fast(self, window_id: str) -> bool:
         """
         快速窗口激活 - 异步版本
-        优化：使用线程池避免阻塞
+        优化：在后台线程执行，调用方最多等待1秒；窗口操作已在进程内或常驻osascript中完成，无需常驻线程池
         """
-        future = self._thread_pool.submit(self.activate_window, window_id)
+        future: Future = Future()
+        
+        def run():
+            try:
+                future.set_result(self.activate_window(window_id))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name='activate-window', daemon=True).start()
         try:
             return future.result(timeout=1.0)  # 1秒总超时
-        except:
+        except Exception:
             return False
     
     def find_window_by_id_fast(self, window_id: str) -> Optional[WindowInfo]:
@@ -393,56 +894,149 @@ class OptimizedMacOSAdapter(PlatformAdapter):
             if not HAS_COCOA:
                 return None
             
-            # 优化：使用Cocoa API直接根据窗口ID查找
-            window_list = Quartz.CGWindowListCopyWindowInfo(
-                Quartz.kCGWindowListOptionOnScreenOnly, 
-                Quartz.kCGNullWindowID
-            )
+            window = self._cg_window(window_id)
+            if window is None:
+                return None
             
-            for window in window_list:
-                if str(window.get('kCGWindowNumber', 0)) == window_id:
-                    owner_name = window.get('kCGWindowOwnerName', '')
-                    title = window.get('kCGWindowName', '')
-                    
-                    logger.debug(f"【hotkey】快速查找窗口成功: {window_id}")
-                    return WindowInfo(
-                        window_id=window_id,
-                        title=title,
-                        app_name=owner_name,
-                        is_active=False,  # 需要额外查询
-                        is_minimized=False
-                    )
+            logger.debug(f"【hotkey】快速查找窗口成功: {window_id}")
+            return WindowInfo(
+                window_id=window_id,
+                title=window.get('kCGWindowName', ''),
+                app_name=window.get('kCGWindowOwnerName', ''),
+                is_active=False,  # 需要额外查询
+                is_minimized=False
+            )
             
+        except Exception as e:
+            logger.warning(f"快速窗口查找失败: {e}")
             return None
+    
+    def _cg_window(self, window_id: str) -> Optional[Any]:
+        """按ID取得窗口的CGWindow字典"""
+        # 优化：快照有效时先查索引；否则只向window server查询这一个窗口
+        if self._cg_snapshot_fresh():
+            window = self._cg_window_index.get(window_id)
+            if window is not None:
+                return window
+            # 快照只含屏幕上的窗口，最小化或位于其他桌面的窗口需单独查询
+            return self._describe_window(window_id)
+        
+        window = self._describe_window(window_id)
+        if window is None:
+            self._cg_windows()
+            window = self._cg_window_index.get(window_id)
+        return window
+    
+    def _ax_window(self, window_id: str) -> Optional[Tuple[int, Any, str]]:
+        """
+        通过辅助功能API找到窗口对应的AXUIElement，返回(进程ID, 窗口元素, 标题)
+        优先用私有API _AXUIElementGetWindow 按CGWindowID精确对应；不可用时要求位置、大小和标题
+        都一致且只有一个窗口符合，否则返回None，由调用方改用按窗口ID定位的AppleScript，不做猜测
+        """
+        if not (HAS_AX and HAS_COCOA and self._check_accessibility_permissions()):
+            return None
+        
+        try:
+            window = self._cg_window(window_id)
+            if window is None:
+                return None
+            
+            pid = window.get('kCGWindowOwnerPID')
             
+            with objc.autorelease_pool():
+                err, ax_windows = AXUIElementCopyAttributeValue(
+                    AXUIElementCreateApplication(pid), kAXWindowsAttribute, None)
+                if err != kAXErrorSuccess or not ax_windows:
+                    return None
+                
+                if _AXUIElementGetWindow is not None:
+                    for ax_window in ax_windows:
+                        err, ax_window_id = _AXUIElementGetWindow(ax_window, None)
+                        if err == kAXErrorSuccess and str(ax_window_id) == window_id:
+                            return pid, ax_window, self._ax_title(ax_window)
+                    return None
+                
+                # 没有屏幕录制权限时Quartz不提供标题，同一应用的两个最大化窗口位置大小也相同，无法区分
+                title = window.get(CG_WINDOW_NAME, '') or ''
+                if not title:
+                    return None
+                bounds = window.get('kCGWindowBounds') or {}
+                target = (round(bounds.get('X', 0)), round(bounds.get('Y', 0)),
+                          round(bounds.get('Width', 0)), round(bounds.get('Height', 0)))
+                matches = [ax_window for ax_window in ax_windows
+                           if self._ax_frame(ax_window) == target and self._ax_title(ax_window) == title]
+                if len(matches) != 1:
+                    return None
+                return pid, matches[0], title
         except Exception as e:
-            logger.warning(f"快速窗口查找失败: {e}")
+            logger.debug(f"辅助功能API查找窗口失败 {window_id}: {e}")
             return None
     
+    @staticmethod
+    def _ax_title(ax_window) -> str:
+        """读取AX窗口的标题，读取失败时返回空字符串"""
+        err, ax_title = AXUIElementCopyAttributeValue(ax_window, kAXTitleAttribute, None)
+        return str(ax_title) if err == kAXErrorSuccess and ax_title else ''
+    
+    @staticmethod
+    def _ax_frame(ax_window) -> Optional[Tuple[int, int, int, int]]:
+        """读取AX窗口的位置和大小"""
+        err, position = AXUIElementCopyAttributeValue(ax_window, kAXPositionAttribute, None)
+        if err != kAXErrorSuccess:
+            return None
+        err, size = AXUIElementCopyAttributeValue(ax_window, kAXSizeAttribute, None)
+        if err != kAXErrorSuccess:
+            return None
+        
+        _, point = AXValueGetValue(position, kAXValueCGPointType, None)
+        _, extent = AXValueGetValue(size, kAXValueCGSizeType, None)
+        return (round(point.x), round(point.y), round(extent.width), round(extent.height))
+    
+    @staticmethod
+    def _is_window_id(window_id: str) -> bool:
+        """窗口ID必须是整数，提前拒绝非法ID，不必等脚本执行时才报错"""
+        if window_id.isdigit():
+            return True
+        logger.warning(f"无效的窗口ID: {window_id!r}")
+        return False
+    
+    def _window_owner(self, window_id: str) -> Optional[str]:
+        """确定窗口所属的应用名：先查Quartz，再查窗口缓存(AppleScript后备方案写入)"""
+        window_info = self.find_window_by_id_fast(window_id)
+        if window_info is not None and window_info.app_name:
+            return window_info.app_name
+        
+        with self._cache_lock:
+            entries = list(self._window_cache.items())
+        for app_name, (_, windows, _, _) in entries:
+            if any(window.window_id == window_id for window in windows):
+                return app_name
+        return None
+    
     def minimize_window(self, window_id: str) -> bool:
         """最小化窗口 - 优化版"""
         try:
-            script = f'''
-            tell application "System Events"
-                try
-                    set minimized of (first window whose id is {window_id}) to true
-                    return true
-                on error
-                    return false
-                end try
-            end tell
-            '''
+            if not self._is_window_id(window_id):
+                return False
             
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=0.3  # 优化：短超时
-            )
+            # 操作前确定所属应用，成功后只让该应用的缓存失效
+            owner = self._window_owner(window_id)
+            
+            ax = self._ax_window(window_id)
+            if ax is not None and AXUIElementSetAttributeValue(ax[1], kAXMinimizedAttribute, True) == kAXErrorSuccess:
+                self._invalidate_app(owner)
+                return True
+            
+            if owner is None:
+                script, args = _MINIMIZE_ANY_WINDOW_SCRIPT, [window_id]
+            else:
+                script, args = _MINIMIZE_WINDOW_SCRIPT, [window_id, owner]
+            result = self._osa_run(script, timeout=0.3,  # 优化：短超时
+                                   args=args, capture=False)
             
-            success = result.returncode == 0 and 'true' in result.stdout
+            success = result.returncode == 0
             if success:
-                self._clear_cache()
+                self._invalidate_app(owner)
             
             return success
             
@@ -453,27 +1047,26 @@ class OptimizedMacOSAdapter(PlatformAdapter):
     def close_window(self, window_id: str) -> bool:
         """关闭窗口 - 优化版"""
         try:
-            script = f'''
-            tell application "System Events"
-                try
-                    perform action "AXCancel" of (first window whose id is {window_id})
-                    return true
-                on error
-                    return false
-                end try
-            end tell
-            '''
+            if not self._is_window_id(window_id):
+                return False
             
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=0.3
-            )
+            owner = self._window_owner(window_id)
+            
+            ax = self._ax_window(window_id)
+            if ax is not None and self._ax_close(ax[1]):
+                self._invalidate_app(owner)
+                return True
+            
+            if owner is None:
+                script, args = _CLOSE_ANY_WINDOW_SCRIPT, [window_id]
+            else:
+                script, args = _CLOSE_WINDOW_SCRIPT, [window_id, owner]
+            result = self._osa_run(script, timeout=0.3,
+                                   args=args, capture=False)
             
-            success = result.returncode == 0 and 'true' in result.stdout
+            success = result.returncode == 0
             if success:
-                self._clear_cache()
+                self._invalidate_app(owner)
             
             return success
             
@@ -481,40 +1074,41 @@ class OptimizedMacOSAdapter(PlatformAdapter):
             logger.error(f"关闭窗口失败 {window_id}: {e}")
             return False
     
+    @staticmethod
+    def _ax_close(ax_window) -> bool:
+        """按下窗口的关闭按钮"""
+        with objc.autorelease_pool():
+            err, button = AXUIElementCopyAttributeValue(ax_window, kAXCloseButtonAttribute, None)
+            if err != kAXErrorSuccess or button is None:
+                return False
+            return AXUIElementPerformAction(button, kAXPressAction) == kAXErrorSuccess
+    
     def get_active_window(self) -> Optional[WindowInfo]:
         """
         获取当前活动窗口
-        优化：缓存活动窗口信息
+        优化：刚激活过的窗口直接返回；否则优先使用Cocoa API，进程内直接查询，无需启动osascript
         """
+        last = self._last_activated
+        if last is not None and time.monotonic() - last[0] < LAST_ACTIVATED_TTL:
+            return last[1]
+        
+        if HAS_COCOA:
+            window = self._get_active_window_cocoa()
+            if window:
+                return window
+        
+        # 后备方案：没有Cocoa或Cocoa未找到窗口时才启动AppleScript
         try:
-            script = '''
-            tell application "System Events"
-                try
-                    set frontApp to name of first application process whose frontmost is true
-                    set frontWindow to window 1 of first application process whose frontmost is true
-                    set windowTitle to name of frontWindow
-                    set windowID to id of frontWindow
-                    return (windowID as string) & "|" & windowTitle & "|" & frontApp
-                on error
-                    return ""
-                end try
-            end tell
-            '''
-            
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=0.5  # 优化：短超时
-            )
+            result = self._osa_run(_ACTIVE_WINDOW_SCRIPT, timeout=0.5)  # 优化：短超时
             
             if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split('|')
-                if len(parts) >= 3:
+                window_id, _, rest = result.stdout.strip().partition(WINDOW_FIELD_SEP)
+                front_app, sep, title = rest.partition(WINDOW_FIELD_SEP)
+                if sep:
                     return WindowInfo(
-                        window_id=parts[0],
-                        title=parts[1],
-                        app_name=parts[2],
+                        window_id=window_id,
+                        title=title,
+                        app_name=front_app,
                         is_active=True,
                         is_minimized=False
                     )
@@ -524,60 +1118,469 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         
         return None
     
+    def _get_active_window_cocoa(self) -> Optional[WindowInfo]:
+        """
+        使用Cocoa API获取当前活动窗口
+        前台应用取自NSWorkspace，窗口列表按前后顺序排列，第一个普通层级窗口即活动窗口
+        """
+        try:
+            with objc.autorelease_pool():
+                front_app = self._workspace.frontmostApplication()
+                if front_app is None:
+                    return None
+                
+                pid = front_app.processIdentifier()
+                window_list = self._cg_windows()
+                
+                for window in window_list:
+                    if window.get('kCGWindowOwnerPID') == pid and window.get('kCGWindowLayer', 0) == 0:
+                        return WindowInfo(
+                            window_id=str(window.get('kCGWindowNumber', 0)),
+                            title=window.get('kCGWindowName', ''),
+                            app_name=str(front_app.localizedName()),
+                            is_active=True,
+                            is_minimized=False
+                        )
+            
+            return None
+            
+        except Exception as e:
+            logger.warning(f"Cocoa API获取活动窗口失败: {e}")
+            return None
+    
     def batch_get_windows(self, app_names: List[str]) -> Dict[str, List[WindowInfo]]:
         """
         批量获取多个应用的窗口信息
-        优化：并发执行，大幅提升多应用查询性能
+        优化：缓存有效的应用直接返回；其余应用只取一次窗口列表快照，按所属应用分组后切分，结果写入缓存
         """
         results = {}
+        current_time = time.time()
         
-        # 使用线程池并发获取
-        future_to_app = {
-            self._thread_pool.submit(self.get_app_windows, app_name): app_name 
-            for app_name in app_names
-        }
+        missing = []
+        for app_name in app_names:
+            cached = self._get_cached_windows(app_name, current_time)
+            if cached is not None:
+                results[app_name] = cached
+            elif app_name not in missing:
+                missing.append(app_name)
+        if not missing:
+            return results
         
-        for future in as_completed(future_to_app, timeout=2.0):
-            app_name = future_to_app[future]
-            try:
-                results[app_name] = future.result()
-            except Exception as e:
-                logger.error(f"批量获取 {app_name} 窗口失败: {e}")
-                results[app_name] = []
+        # 没有Cocoa时一次AppleScript拿到所有未命中应用的窗口
+        if not HAS_COCOA:
+            windows_by_app = self._get_all_windows_applescript(missing)
+            for app_name in missing:
+                results[app_name] = windows_by_app.get(app_name, [])
+                self._update_cache(app_name, results[app_name], current_time)
+            return results
+        
+        try:
+            by_owner = self._cg_windows_by_owner()
+        except Exception as e:
+            logger.error(f"批量获取窗口失败: {e}")
+            results.update((app_name, []) for app_name in missing)
+            return results
+        
+        for app_name in missing:
+            results[app_name] = list(self._iter_windows_from_cg(app_name, by_owner.get(app_name, ())))
+            self._update_cache(app_name, results[app_name], current_time, on_screen=True)
         
         return results
     
-    def _is_cache_valid(self, app_name: str, current_time: float) -> bool:
-        """检查缓存是否有效"""
-        if app_name not in self._window_cache:
-            return False
+    def _get_cached_windows(self, app_name: str, current_time: float) -> Optional[List[WindowInfo]]:
+        """返回未过期的缓存窗口列表，没有或已过期时返回None"""
+        entry = self._window_cache.get(app_name)
+        if entry is None:
+            return None
+        
+        # 屏幕窗口列表的变化不全有通知，只有AppleScript获取的列表可由通知维护
+        observed = not entry[3] and self._is_observed(app_name)
         
-        last_update = self._cache_timestamps.get(app_name, 0)
-        return (current_time - last_update) < self._cache_timeout
+        with self._cache_lock:
+            if observed:
+                ttl = WINDOW_CACHE_TTL_OBSERVED
+            else:
+                ttl = self._cache_ttl.get(app_name, self._cache_timeout)
+            if (current_time - entry[0]) >= ttl * entry[2]:
+                return None
+            
+            hits = self._cache_hits.get(app_name, 0) + 1
+            if hits >= WINDOW_CACHE_GROW_HITS:
+                self._cache_ttl[app_name] = min(WINDOW_CACHE_TTL_MAX, ttl * 1.5)
+                hits = 0
+            self._cache_hits[app_name] = hits
+        return entry[1]
     
-    def _update_cache(self, app_name: str, windows: List[WindowInfo], timestamp: float):
-        """更新缓存"""
-        self._window_cache[app_name] = windows
-        self._cache_timestamps[app_name] = timestamp
+    def _update_cache(self, app_name: str, windows: List[WindowInfo], timestamp: float,
+                      on_screen: bool = False):
+        """更新缓存；on_screen表示窗口来自Quartz屏幕窗口列表"""
+        jitter = random.uniform(1 - WINDOW_CACHE_TTL_JITTER, 1 + WINDOW_CACHE_TTL_JITTER)
+        with self._cache_lock:
+            self._window_cache[app_name] = (timestamp, windows, jitter, on_screen)
+            self._window_cache.move_to_end(app_name)
+            while len(self._window_cache) > self._window_cache_maxsize:
+                evicted, _ = self._window_cache.popitem(last=False)
+                self._cache_ttl.pop(evicted, None)
+                self._cache_hits.pop(evicted, None)
         logger.debug(f"更新 {app_name} 窗口缓存，共 {len(windows)} 个窗口")
+        
+        if HAS_AX_OBSERVER and HAS_AX and HAS_COCOA and app_name not in self._ax_observers:
+            self._request_observe(app_name)
+    
+    def _request_observe(self, app_name: str):
+        """把应用排入待注册队列，由后台run loop线程注册AXObserver；调用方不做任何辅助功能调用"""
+        with self._ax_observers_lock:
+            if (self._ax_stopping or app_name in self._ax_observers
+                    or app_name in self._ax_pending or app_name in self._ax_failed):
+                return
+            self._ax_pending.add(app_name)
+            self._ax_queue.append(app_name)
+            self._ensure_ax_thread()
+            if self._ax_runloop is not None:
+                # 让当前这轮run loop返回，后台线程随即处理队列
+                CFRunLoopStop(self._ax_runloop)
+        self._ax_wakeup.set()
+    
+    def _register_queued_observers(self):
+        """后台线程：逐个注册排队的应用，失败的应用记录下来，之后的缓存写入不再排队"""
+        while True:
+            with self._ax_observers_lock:
+                if not self._ax_queue or self._ax_stopping:
+                    return
+                app_name = self._ax_queue.popleft()
+            
+            registered = self._observe_app(app_name)
+            
+            with self._ax_observers_lock:
+                self._ax_pending.discard(app_name)
+                if not registered:
+                    self._ax_failed.add(app_name)
+    
+    def _observe_app(self, app_name: str) -> bool:
+        """
+        为应用注册AXObserver，窗口创建/销毁/改名/最小化时使该应用的缓存失效，只在后台run loop线程中调用
+        新窗口通知注册在应用元素上，其余通知注册在每个窗口上(包括之后新建的窗口)
+        需要辅助功能权限；任何一项注册失败时都不算已观察，返回False，该应用继续按TTL过期
+        """
+        if not self._check_accessibility_permissions():
+            return False
+        
+        pid = next((app.pid for app in self._get_running_apps_cached() if app.name == app_name), None)
+        if pid is None:
+            return False
+        
+        entry = None
+        
+        def on_notification(observer, element, notification, refcon):
+            if (notification == 'AXWindowCreated'
+                    and not self._add_ax_notifications(observer, element, _AX_WINDOW_NOTIFICATIONS)):
+                # 新窗口注册失败，收不到它的关闭/最小化通知，改回按TTL过期
+                self._unobserve_app(app_name, entry)
+            self._on_window_notification(app_name)
+        
+        try:
+            with objc.autorelease_pool():
+                err, observer = AXObserverCreate(pid, on_notification, None)
+                if err != kAXErrorSuccess:
+                    return False
+                element = AXUIElementCreateApplication(pid)
+                # 先注册新窗口通知再列出现有窗口，两步之间新建的窗口也不会漏掉
+                if not self._add_ax_notifications(observer, element, _AX_APP_NOTIFICATIONS):
+                    return False
+                err, ax_windows = AXUIElementCopyAttributeValue(element, kAXWindowsAttribute, None)
+                if err != kAXErrorSuccess:
+                    return False
+                for ax_window in ax_windows or ():
+                    if not self._add_ax_notifications(observer, ax_window, _AX_WINDOW_NOTIFICATIONS):
+                        return False
+        except Exception as e:
+            logger.debug(f"注册窗口通知失败 {app_name}: {e}")
+            return False
+        
+        with self._ax_observers_lock:
+            if self._ax_stopping:
+                return True
+            entry = (pid, observer)
+            self._ax_observers[app_name] = entry
+            # 本方法在run loop线程中执行，直接挂到该线程的run loop上
+            CFRunLoopAddSource(self._ax_runloop, AXObserverGetRunLoopSource(observer), kCFRunLoopDefaultMode)
+        logger.debug(f"已注册 {app_name} 的窗口变化通知")
+        return True
+    
+    def _is_observed(self, app_name: str) -> bool:
+        """应用是否由窗口通知维护缓存；进程已退出时注销其观察者"""
+        entry = self._ax_observers.get(app_name)
+        if entry is None:
+            return False
+        
+        try:
+            os.kill(entry[0], 0)
+            return True
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            return True
+        
+        # 应用退出(可能已重新启动为新进程)，旧观察者不会再收到通知
+        self._unobserve_app(app_name, entry)
+        return False
+    
+    @staticmethod
+    def _add_ax_notifications(observer, element, notifications: Sequence[str]) -> bool:
+        """在元素上注册一组通知，全部成功(或此前已注册)时返回True"""
+        for notification in notifications:
+            err = AXObserverAddNotification(observer, element, notification, None)
+            if err not in (kAXErrorSuccess, kAXErrorNotificationAlreadyRegistered):
+                return False
+        return True
+    
+    def _unobserve_app(self, app_name: str, entry: Optional[Tuple[int, Any]]):
+        """注销应用的观察者；仍是同一个观察者时才注销，不影响重新注册的新观察者"""
+        with self._ax_observers_lock:
+            if entry is None or self._ax_observers.get(app_name) is not entry:
+                return
+            del self._ax_observers[app_name]
+            if self._ax_runloop is not None:
+                CFRunLoopRemoveSource(self._ax_runloop, AXObserverGetRunLoopSource(entry[1]), kCFRunLoopDefaultMode)
+    
+    def _ensure_ax_thread(self):
+        """启动接收窗口通知的后台run loop线程，调用方需持有 _ax_observers_lock"""
+        if self._ax_thread is not None:
+            return
+        self._ax_thread = threading.Thread(target=self._ax_run_loop, name='ax-observer', daemon=True)
+        self._ax_thread.start()
+    
+    def _ax_run_loop(self):
+        """后台线程：注册排队的观察者，运行CFRunLoop接收AXObserver通知"""
+        with self._ax_observers_lock:
+            self._ax_runloop = CFRunLoopGetCurrent()
+        
+        while not self._ax_stopping:
+            self._register_queued_observers()
+            result = CFRunLoopRunInMode(kCFRunLoopDefaultMode, 1.0, False)
+            if result == kCFRunLoopRunFinished:
+                # 还没有任何观察者，等待注册
+                self._ax_wakeup.wait(1.0)
+                self._ax_wakeup.clear()
+    
+    def _on_window_notification(self, app_name: str):
+        """窗口变化通知回调：只让该应用的缓存失效"""
+        with self._cache_lock:
+            self._window_cache.pop(app_name, None)
+        self._cg_snapshot = None
+        self._last_activated = None
+        logger.debug(f"收到 {app_name} 窗口变化通知，清除缓存")
+    
+    def _stop_ax_observers(self):
+        """注销全部窗口通知并停止后台run loop"""
+        with self._ax_observers_lock:
+            self._ax_stopping = True
+            if self._ax_runloop is not None:
+                for _, observer in self._ax_observers.values():
+                    CFRunLoopRemoveSource(self._ax_runloop, AXObserverGetRunLoopSource(observer), kCFRunLoopDefaultMode)
+                CFRunLoopStop(self._ax_runloop)
+            self._ax_observers.clear()
+            self._ax_queue.clear()
+            self._ax_pending.clear()
+        self._ax_wakeup.set()
+    
+    def _cg_windows(self) -> list:
+        """
+        获取屏幕上的窗口列表(CGWindowListCopyWindowInfo)
+        优化：短时共享快照，同一次热键操作中的多次查询只访问一次window server；
+        一次遍历同时按窗口ID和所属应用建立索引
+        """
+        if not self._cg_snapshot_fresh():
+            current_time = time.monotonic()
+            # 在自动释放池内调用，后台线程和热键回调中产生的临时ObjC对象随即释放
+            with objc.autorelease_pool():
+                window_list = Quartz.CGWindowListCopyWindowInfo(
+                    Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+                    Quartz.kCGNullWindowID
+                )
+                by_id: Dict[str, Any] = {}
+                by_owner: Dict[str, list] = {}
+                for window in window_list:
+                    by_id[str(window.get(CG_WINDOW_NUMBER, 0))] = window
+                    by_owner.setdefault(window.get(CG_WINDOW_OWNER_NAME), []).append(window)
+                # 先换索引再换快照，读到新快照的线程不会拿到旧索引
+                self._cg_window_index = by_id
+                self._cg_owner_index = by_owner
+                self._cg_snapshot = (current_time, window_list)
+        return self._cg_snapshot[1]
+    
+    def _cg_windows_by_owner(self) -> Dict[str, list]:
+        """返回按所属应用名分组的窗口列表快照"""
+        self._cg_windows()
+        return self._cg_owner_index
+    
+    def _cg_snapshot_fresh(self) -> bool:
+        """检查窗口列表快照是否仍在有效期内"""
+        if self._cg_snapshot is None:
+            return False
+        return self._oneshot_active or time.monotonic() - self._cg_snapshot[0] < CG_SNAPSHOT_TTL
+    
+    @contextmanager
+    def oneshot(self):
+        """
+        一次用户操作内的多次窗口/应用查询共享同一份快照
+        块内首次查询时获取窗口列表和运行应用列表，之后的查询直接复用；窗口操作仍会使快照失效
+        """
+        depth = getattr(self._oneshot_local, 'depth', 0)
+        if depth == 0:
+            # 进入最外层时丢弃过期快照，保证块内数据从本次操作开始时获取
+            if not self._cg_snapshot_fresh():
+                self._cg_snapshot = None
+            if time.monotonic() - self._apps_cache_ts >= RUNNING_APPS_CACHE_TTL:
+                self._apps_cache = None
+        
+        # 按线程计数：只影响调用线程，嵌套的内层块退出时不会提前结束外层块
+        self._oneshot_local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._oneshot_local.depth = depth
+    
+    @property
+    def _oneshot_active(self) -> bool:
+        """当前线程是否在oneshot()块内"""
+        return getattr(self._oneshot_local, 'depth', 0) > 0
+    
+    def _describe_window(self, window_id: str) -> Optional[Any]:
+        """只获取单个窗口的描述(CGWindowListCreateDescriptionFromArray)，避免复制全部窗口信息"""
+        try:
+            with objc.autorelease_pool():
+                descriptions = Quartz.CGWindowListCreateDescriptionFromArray([int(window_id)])
+        except Exception as e:
+            logger.debug(f"按ID获取窗口描述失败 {window_id}: {e}")
+            return None
+        
+        if descriptions and len(descriptions) > 0:
+            return descriptions[0]
+        return None
+    
+    def _invalidate_app(self, app_name: Optional[str]):
+        """
+        只清除指定应用的窗口缓存，其他应用的缓存继续有效
+        窗口列表快照是全局的，一并丢弃；无法确定所属应用时清除全部缓存
+        """
+        if app_name is None:
+            self._clear_cache()
+            return
+        
+        with self._cache_lock:
+            self._window_cache.pop(app_name, None)
+            # 窗口刚被操作过，缩短该应用的有效期以减少读到旧数据
+            ttl = self._cache_ttl.get(app_name, self._cache_timeout)
+            self._cache_ttl[app_name] = max(WINDOW_CACHE_TTL_MIN, ttl / 2)
+            self._cache_hits[app_name] = 0
+        self._cg_snapshot = None
+        self._last_activated = None
+        logger.debug(f"清除 {app_name} 窗口缓存")
     
     def _clear_cache(self):
         """清除所有缓存"""
-        self._window_cache.clear()
-        self._cache_timestamps.clear()
+        with self._cache_lock:
+            self._window_cache.clear()
+        self._cg_snapshot = None
+        self._last_activated = None
         logger.debug("清除窗口缓存")
     
     def cleanup(self):
         """清理资源"""
         self._clear_cache()
-        if hasattr(self, '_thread_pool'):
-            self._thread_pool.shutdown(wait=False)
-        
+        if HAS_AX_OBSERVER:
+            self._stop_ax_observers()
+        with self._osa_lock:
+            self._stop_osa()
         logger.info("优化版macOS适配器已清理")
     
+    def _osa_run(self, script: str, timeout: float, args: Sequence[str] = (),
+                 capture: bool = True) -> subprocess.CompletedProcess:
+        """
+        通过常驻osascript进程执行AppleScript
+        优化：省去每次启动osascript进程的开销；常驻进程不可用时退回一次性调用
+        
+        Args:
+            script: AppleScript源码，带参数时需定义 on run argv
+            timeout: 超时时间(秒)
+            args: 传给 on run argv 的参数
+            capture: 是否需要输出；不需要时一次性调用不建立管道，只返回退出码
+        
+        Raises:
+            subprocess.TimeoutExpired: 执行超时
+        """
+        with self._osa_lock:
+            try:
+                read_timeout = timeout
+                if self._osa_proc is None or self._osa_proc.poll() is not None:
+                    self._osa_proc = subprocess.Popen(
+                        [OSASCRIPT_PATH, '-l', 'JavaScript', '-e', _OSA_SERVER_JS],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        bufsize=0,
+                        close_fds=False
+                    )
+                    # 启动耗时不计入脚本本身的超时
+                    read_timeout += OSA_STARTUP_TIMEOUT
+                
+                request = json.dumps({'src': script, 'args': [str(arg) for arg in args]})
+                self._osa_proc.stdin.write((request + '\n').encode('utf-8'))
+                line = self._osa_readline(read_timeout)
+            except subprocess.TimeoutExpired:
+                # 脚本卡住，丢弃常驻进程，下次调用重新启动
+                self._stop_osa()
+                raise
+            except (OSError, ValueError) as e:
+                logger.debug(f"常驻osascript不可用，改用一次性调用: {e}")
+                self._stop_osa()
+                line = None
+        
+        if line is None:
+            if not capture:
+                return subprocess.run([OSASCRIPT_PATH, '-e', script, *map(str, args)],
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                      timeout=timeout, close_fds=False)
+            return subprocess.run([OSASCRIPT_PATH, '-e', script, *map(str, args)],
+                                  capture_output=True, text=True, timeout=timeout, close_fds=False)
+        
+        reply = json.loads(line)
+        if reply.get('ok'):
+            return subprocess.CompletedProcess(script, 0, reply.get('out', '') + '\n', '')
+        return subprocess.CompletedProcess(script, 1, '', reply.get('err', ''))
+    
+    def _osa_readline(self, timeout: float) -> str:
+        """从常驻osascript进程读取一行结果，调用方需持有 _osa_lock"""
+        fd = self._osa_proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        chunks = []
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired('osascript', timeout)
+            
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise OSError("常驻osascript进程已退出")
+            chunks.append(chunk)
+            if chunk.endswith(b'\n'):
+                return b''.join(chunks).decode('utf-8')
+    
+    def _stop_osa(self):
+        """结束常驻osascript进程，调用方需持有 _osa_lock"""
+        if self._osa_proc is not None:
+            try:
+                self._osa_proc.kill()
+                self._osa_proc.wait(timeout=1)
+            except Exception:
+                pass
+            self._osa_proc = None
+    
     def register_hotkey(self, hotkey: str, callback: Callable) -> bool:
         """注册全局热键"""
-        logger.info(f"【mac_hotkey】注册热键: '{hotkey}'")
+        logger.info("【mac_hotkey】注册热键: '%s'", hotkey)
         if not keyboard:
             logger.error("【mac_hotkey】pynput不可用")
             return False
@@ -588,11 +1591,20 @@ class OptimizedMacOSAdapter(PlatformAdapter):
         
         try:
             key_combination = self._parse_hotkey(hotkey)
-            logger.info(f"【mac_hotkey】解析热键: '{hotkey}' 为: '{key_combination}'")
+            logger.debug("【mac_hotkey】解析热键: '%s' 为: '%s'", hotkey, key_combination)
             if not key_combination:
                 return False
             
+            last_fire = 0.0
+            
             def on_hotkey():
+                # 去抖：间隔过短的重复触发直接忽略，避免连续触发AppleScript
+                nonlocal last_fire
+                now = time.monotonic()
+                if now - last_fire < self._hotkey_debounce:
+                    return
+                last_fire = now
+                
                 try:
                     callback()
                 except Exception as e:
@@ -626,102 +1638,158 @@ class OptimizedMacOSAdapter(PlatformAdapter):
             logger.error(f"注销热键失败 {hotkey}: {e}")
             return False
     
+    def unregister_all_hotkeys(self) -> bool:
+        """注销全部热键"""
+        try:
+            for listener in self._hotkey_listeners.values():
+                listener.stop()
+            self._hotkey_listeners.clear()
+            self._running_listener = None
+            return True
+        except Exception as e:
+            logger.error(f"注销全部热键失败: {e}")
+            return False
+    
     def is_app_running(self, app_name: str) -> bool:
-        """检查应用是否运行"""
+        """
+        检查应用是否运行
+        优化：传入bundle ID时直接按ID查询；否则查名称索引，精确匹配优先，再做子串匹配
+        """
         try:
-            if HAS_COCOA:
-                workspace = NSWorkspace.sharedWorkspace()
-                running_apps = workspace.runningApplications()
-                
-                for app in running_apps:
-                    if app.activationPolicy() == 0:
-                        name = str(app.localizedName())
-                        if app_name.lower() in name.lower():
-                            return True
-            else:
-                for proc in psutil.process_iter(['name']):
-                    try:
-                        if app_name.lower() in proc.info['name'].lower():
-                            return True
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+            if HAS_COCOA and self._is_bundle_id(app_name):
+                with objc.autorelease_pool():
+                    found = NSRunningApplication.runningApplicationsWithBundleIdentifier_(app_name).count() > 0
+                if found:
+                    return True
+            
+            self._get_running_apps_cached()
+            name_lower = app_name.lower()
+            return (name_lower in self._apps_name_index
+                    or any(name_lower in name for name in self._apps_name_index))
         except Exception as e:
             logger.error(f"检查应用运行状态失败: {e}")
         
         return False
     
     def kill_app(self, app_name: str, force: bool = False) -> bool:
-        """终止应用"""
+        """
+        终止应用
+        优化：优先通过NSRunningApplication在进程内发送退出请求，无需启动osascript
+        """
         try:
+            if HAS_COCOA and self._terminate_cocoa(app_name, force):
+                self._invalidate_apps_cache()
+                return True
+            
+            # 后备方案：Cocoa不可见的进程
+            # 输出不被使用，直接丢弃，避免建立管道
             if force:
-                subprocess.run(['killall', '-9', app_name], check=False)
+                subprocess.run([KILLALL_PATH, '-9', app_name], check=False,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
             else:
-                script = f'tell application "{app_name}" to quit'
-                subprocess.run(['osascript', '-e', script], check=False)
+                subprocess.run([OSASCRIPT_PATH, '-e', _QUIT_APP_SCRIPT, app_name], check=False,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+            self._invalidate_apps_cache()
             return True
         except Exception as e:
             logger.error(f"终止应用失败 {app_name}: {e}")
             return False
     
-    def get_default_terminal(self) -> str:
-        """获取默认终端"""
-        terminals = [
-            "/Applications/iTerm.app",
-            "/Applications/Terminal.app",
-            "/System/Applications/Terminal.app"
-        ]
+    def _terminate_cocoa(self, app_name: str, force: bool) -> bool:
+        """按应用名(不区分大小写的完整匹配)终止应用，返回是否找到匹配的应用"""
+        app_name_lower = app_name.lower()
+        found = False
         
-        for terminal in terminals:
-            if os.path.exists(terminal):
-                return terminal
+        with objc.autorelease_pool():
+            for app in self._workspace.runningApplications():
+                # 在NSString一侧比较，只有命中时才需要桥接为Python字符串
+                name = app.localizedName()
+                if name is not None and name.lowercaseString().isEqualToString_(app_name_lower):
+                    if force:
+                        app.forceTerminate()
+                    else:
+                        app.terminate()
+                    found = True
         
-        return "Terminal"
+        return found
+    
+    def get_default_terminal(self) -> str:
+        """获取默认终端"""
+        return _find_default_terminal()
     
     def normalize_app_path(self, app_path: str) -> str:
-        """规范化应用路径"""
+        """
+        规范化应用路径
+        优化：首次调用时列出各Applications目录建立索引，之后按名称直接查找
+        """
         path = os.path.expanduser(app_path)
         
         if not path.startswith('/') and not path.endswith('.app'):
+            if self._app_index is None:
+                self._app_index = self._build_app_index()
+            
+            hit = self._app_index.get(path.lower())
+            if hit:
+                return hit
+            
+            # 索引未命中：可能是之后安装的应用，逐个目录确认
             app_name = path + '.app'
-            for search_path in ['/Applications', '/System/Applications', 
-                              os.path.expanduser('~/Applications')]:
-                full_path = os.path.join(search_path, app_name)
+            for search_path in APP_SEARCH_PATHS:
+                full_path = os.path.join(os.path.expanduser(search_path), app_name)
                 if os.path.exists(full_path):
+                    self._app_index[path.lower()] = full_path
                     return full_path
         
         return path
     
-    def _parse_hotkey(self, hotkey: str) -> Optional[str]:
-        """解析热键字符串"""
-        key_mapping = {
-            'cmd': 'cmd', 'ctrl': 'ctrl', 'alt': 'alt', 'shift': 'shift',
-            'option': 'alt', 'command': 'cmd'
-        }
-        
-        keys = [key.strip().lower() for key in hotkey.split('+')]
-        normalized_keys = []
-        
-        for key in keys:
-            if key in key_mapping:
-                normalized_keys.append(f'<{key_mapping[key]}>')
-            elif len(key) == 1:
-                normalized_keys.append(key)
-            else:
-                normalized_keys.append(f'<{key}>')
-        
+    def _build_app_index(self) -> Dict[str, str]:
+        """列出各Applications目录，建立 小写应用名 -> .app路径 的索引，靠前的目录优先"""
+        index: Dict[str, str] = {}
+        for search_path in APP_SEARCH_PATHS:
+            directory = os.path.expanduser(search_path)
+            try:
+                entries = os.listdir(directory)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.endswith('.app'):
+                    index.setdefault(entry[:-4].lower(), os.path.join(directory, entry))
+        return index
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_hotkey(hotkey: str) -> Optional[str]:
+        """解析热键字符串，结果只取决于输入，缓存复用"""
+        keys = (key.strip() for key in hotkey.lower().split('+'))
+        normalized_keys = [
+            _KEY_MAPPING.get(key, key if len(key) == 1 else f'<{key}>')
+            for key in keys
+        ]
         return '+'.join(normalized_keys) if normalized_keys else None
     
-    # todo 这个方法比较慢，250ms,不过只有启动时候调用一次，可以接受
     def _check_accessibility_permissions(self) -> bool:
-        """检查辅助功能权限"""
+        """
+        检查辅助功能权限
+        优化：优先调用AXIsProcessTrusted，进程内直接返回；已授权的结果缓存，权限授予后无需重复检查
+        """
+        if self._accessibility_trusted:
+            return True
+        
+        if HAS_AX:
+            trusted = bool(AXIsProcessTrusted())
+            self._accessibility_trusted = trusted
+            return trusted
+        
+        # 后备方案：通过AppleScript探测，约250ms
         try:
             start_time = time.time()
-            result = subprocess.run([
-                'osascript', '-e', 
-                'tell application "System Events" to get name of first process'
-            ], capture_output=True, text=True, timeout=1)
+            result = self._osa_run(
+                'tell application "System Events" to get name of first process',
+                timeout=1
+            )
             end_time = time.time()
             logger.info(f"【mac_hotkey】检查辅助功能权限耗时: {(end_time - start_time) * 1000:.2f}ms")
-            return result.returncode == 0
+            self._accessibility_trusted = result.returncode == 0
+            return self._accessibility_trusted
         except Exception:
             return False
@@ -217,6 +217,18 @@ class WindowsAdapter(PlatformAdapter):
             logger.error(f"Failed to unregister hotkey {hotkey}: {e}")
             return False
     
+    def unregister_all_hotkeys(self) -> bool:
+        """Unregister all global hotkeys at once."""
+        try:
+            for listener in self._hotkey_listeners.values():
+                listener.stop()
+            self._hotkey_listeners.clear()
+            self._running_listener = None
+            return True
+        except Exception as e:
+            logger.error(f"Failed to unregister all hotkeys: {e}")
+            return False
+    
     def get_active_window(self) -> Optional[WindowInfo]:
         """Get information about the currently active window."""
         if not HAS_WIN32:
@@ -1,12 +1,11 @@
 """Terminal management module for Terminal Controller."""
 import os
-import sys
 import subprocess
 import logging
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
-from .platform import get_platform_adapter, PlatformAdapter
+from .platform import get_platform_adapter, PlatformAdapter, CURRENT_PLATFORM
 from .config_manager import ConfigManager
 
 
@@ -24,15 +23,7 @@ class TerminalManager:
         """
         self.config_manager = config_manager
         self.platform_adapter: PlatformAdapter = get_platform_adapter()()
-        p = sys.platform.lower()
-        if p.startswith("darwin") or p in ("mac", "macos"):
-            self.current_platform = "darwin"
-        elif p.startswith("linux"):
-            self.current_platform = "linux"
-        elif p.startswith("win"):
-            self.current_platform = "windows"
-        else:
-            self.current_platform = p
+        self.current_platform = CURRENT_PLATFORM
         
         logger.info(f"Initialized TerminalManager for platform: {self.current_platform}")
     
@@ -1,7 +1,7 @@
 """Window management module for Terminal Controller."""
 import logging
 import time
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from threading import Timer
 
 from .platform import get_platform_adapter, PlatformAdapter
@@ -11,11 +11,17 @@ from .config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Window listings are reused for this long, so back-to-back lookups in one
+# hotkey press don't enumerate native windows twice
+WINDOW_LIST_CACHE_TTL = 0.2
+
 # 统一的性能日志前缀
 PERF_LOG_PREFIX = "[PERF]"
 
 def log_perf(msg: str, duration_ms: Optional[float] = None):
     """统一的性能日志记录函数"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if duration_ms is not None:
         logger.info(f"{PERF_LOG_PREFIX} {msg} - {duration_ms:.2f}ms")
     else:
@@ -34,38 +40,50 @@ class WindowManager:
         self.config_manager = config_manager
         self.platform_adapter: PlatformAdapter = get_platform_adapter()()
         self._selection_timers: Dict[str, Timer] = {}
+        # filter_app -> (monotonic timestamp, windows) for list_all_windows
+        self._window_list_cache: Dict[Optional[str], Tuple[float, List[WindowInfo]]] = {}
         
         logger.info("Initialized WindowManager")
     
     def list_all_windows(self, filter_app: Optional[str] = None) -> List[WindowInfo]:
         """List all windows or windows for a specific application.
         
+        Results are cached for WINDOW_LIST_CACHE_TTL seconds; window
+        actions invalidate the cache.
+        
         Args:
             filter_app: Application name to filter by (optional)
             
         Returns:
             List of window information
         """
+        cached = self._window_list_cache.get(filter_app)
+        if cached is not None and time.monotonic() - cached[0] < WINDOW_LIST_CACHE_TTL:
+            return list(cached[1])
+        
         try:
             if filter_app:
                 app_config = self.config_manager.get_app_config(filter_app)
                 if app_config:
-                    return self.platform_adapter.get_app_windows(app_config.name)
+                    all_windows = self.platform_adapter.get_app_windows(app_config.name)
                 else:
                     logger.warning(f"Unknown application: {filter_app}")
                     return []
             else:
                 # Get all running apps and their windows
                 all_windows = []
-                running_apps = self.platform_adapter.get_running_apps()
-                
-                for app in running_apps:
-                    windows = self.platform_adapter.get_app_windows(app.name)
-                    all_windows.extend(windows)
+                with self.platform_adapter.oneshot():
+                    running_apps = self.platform_adapter.get_running_apps()
+                    
+                    for app in running_apps:
+                        windows = self.platform_adapter.get_app_windows(app.name)
+                        all_windows.extend(windows)
                 
                 # Sort by application name, then by window title
                 all_windows.sort(key=lambda w: (w.app_name, w.title))
-                return all_windows
+            
+            self._window_list_cache[filter_app] = (time.monotonic(), all_windows)
+            return list(all_windows)
                 
         except Exception as e:
             logger.error(f"Error listing windows: {e}")
@@ -219,13 +237,13 @@ class WindowManager:
             True if activation was successful, False otherwise
         """
         try:
-            import time
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             success = self.platform_adapter.activate_window(window_id)
-            duration = (time.time() - start_time) * 1000
-            logger.info(f"【hotkey】Platform adapter activate_window - {duration:.2f}ms, success: {success}")  # 平台适配器激活窗口耗时
+            self._window_list_cache.clear()
+            duration = (time.monotonic_ns() - start_ns) / 1e6
+            logger.info("【hotkey】Platform adapter activate_window - %.2fms, success: %s", duration, success)  # 平台适配器激活窗口耗时
             if success:
-                logger.info(f"Activated window {window_id}")
+                logger.info("Activated window %s", window_id)
             else:
                 logger.warning(f"Failed to activate window {window_id}")
             
@@ -246,6 +264,7 @@ class WindowManager:
         """
         try:
             success = self.platform_adapter.minimize_window(window_id)
+            self._window_list_cache.clear()
             if success:
                 logger.info(f"Minimized window {window_id}")
             else:
@@ -268,6 +287,7 @@ class WindowManager:
         """
         try:
             success = self.platform_adapter.close_window(window_id)
+            self._window_list_cache.clear()
             if success:
                 logger.info(f"Closed window {window_id}")
             else:
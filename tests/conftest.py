@@ -3,6 +3,7 @@ import os
 import sys
 import tempfile
 import shutil
+from contextlib import nullcontext
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -116,12 +117,14 @@ def mock_platform_adapter():
     mock_adapter.close_window.return_value = True
     mock_adapter.register_hotkey.return_value = True
     mock_adapter.unregister_hotkey.return_value = True
+    mock_adapter.unregister_all_hotkeys.return_value = True
     mock_adapter.get_active_window.return_value = None
     mock_adapter.is_app_running.return_value = False
     mock_adapter.kill_app.return_value = True
     mock_adapter.open_url.return_value = True
     mock_adapter.get_default_terminal.return_value = 'test-terminal'
     mock_adapter.normalize_app_path.side_effect = lambda x: x
+    mock_adapter.oneshot.side_effect = nullcontext
     
     return mock_adapter
 
@@ -1,8 +1,9 @@
 """Unit tests for ConfigManager module."""
+import os
 import pytest
 import yaml
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 
 from src.config_manager import (
     ConfigManager, AppConfig, WebsiteConfig, SettingsConfig,
@@ -206,6 +207,45 @@ class TestConfigManager:
         assert success is True
         assert len(config_manager._apps) > 0
     
+    def test_config_version_changes(self, config_manager):
+        """Test that the config version changes on reload and app edits."""
+        version = config_manager.get_config_version()
+        
+        config_manager.reload()
+        assert config_manager.get_config_version() != version
+        
+        version = config_manager.get_config_version()
+        config_manager.remove_app('test_app')
+        assert config_manager.get_config_version() != version
+    
+    def test_get_latest_interactive_session_cached(self, config_manager, tmp_path):
+        """Test that the latest session is cached until the runtime dir changes."""
+        (tmp_path / "terminal_controller").mkdir()
+        sessions = [
+            {"pid": 1, "window_id": "older", "started_at": 1.0},
+            {"pid": 2, "window_id": "newer", "started_at": 2.0}
+        ]
+        
+        with patch('tempfile.gettempdir', return_value=str(tmp_path)), \
+             patch.dict('sys.modules', {'psutil': Mock(pid_exists=Mock(return_value=True))}), \
+             patch.object(config_manager, 'get_active_interactive_sessions',
+                          return_value=sessions) as mock_sessions:
+            assert config_manager.get_latest_interactive_session()["window_id"] == "newer"
+            assert config_manager.get_latest_interactive_session()["window_id"] == "newer"
+            mock_sessions.assert_called_once()
+            
+            (tmp_path / "terminal_controller" / "tc_interactive_3.pid").write_text("{}")
+            config_manager.get_latest_interactive_session()
+            assert mock_sessions.call_count == 2
+            
+            # Rewriting a session file in place leaves the directory mtime alone
+            pid_file = tmp_path / "terminal_controller" / "tc_interactive_3.pid"
+            stat = pid_file.stat()
+            pid_file.write_text('{"pid": 3}')
+            os.utime(pid_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            config_manager.get_latest_interactive_session()
+            assert mock_sessions.call_count == 3
+    
     @patch('builtins.open', side_effect=FileNotFoundError())
     def test_load_apps_file_not_found(self, mock_open, temp_config_dir):
         """Test loading apps when file doesn't exist."""
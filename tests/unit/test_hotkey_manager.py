@@ -0,0 +1,191 @@
+"""Unit tests for HotkeyManager module."""
+import pytest
+from unittest.mock import Mock, patch
+
+from src.hotkey_manager import HotkeyManager, HotkeyBinding
+from src.platform.base import WindowInfo
+
+
+class TestHotkeyManager:
+    """Test cases for HotkeyManager class."""
+
+    @pytest.fixture
+    def hotkey_manager(self, config_manager, mock_platform_adapter):
+        """Create HotkeyManager instance with mocked dependencies."""
+        with patch('src.hotkey_manager.get_platform_adapter') as mock_get_adapter:
+            mock_get_adapter.return_value = lambda: mock_platform_adapter
+
+            hotkey_manager = HotkeyManager(config_manager)
+            hotkey_manager.platform_adapter = mock_platform_adapter
+            return hotkey_manager
+
+    def test_register_hotkey(self, hotkey_manager, mock_platform_adapter):
+        """Test registering a hotkey binding."""
+        callback = Mock()
+
+        result = hotkey_manager.register_hotkey("test", "ctrl+t", callback, "Test")
+
+        assert result is True
+        assert hotkey_manager.get_binding("test").hotkey == "ctrl+t"
+        mock_platform_adapter.register_hotkey.assert_called_once()
+
+    def test_registered_callback_dispatches(self, hotkey_manager, mock_platform_adapter):
+        """Test that the platform callback invokes the bound callback and swallows errors."""
+        callback = Mock(side_effect=RuntimeError("boom"))
+        hotkey_manager.register_hotkey("test", "ctrl+t", callback)
+
+        platform_callback = mock_platform_adapter.register_hotkey.call_args[0][1]
+        platform_callback()
+
+        callback.assert_called_once_with()
+
+    def test_register_hotkey_platform_failure(self, hotkey_manager, mock_platform_adapter):
+        """Test registration when the platform adapter fails."""
+        mock_platform_adapter.register_hotkey.return_value = False
+
+        result = hotkey_manager.register_hotkey("test", "ctrl+t", Mock())
+
+        assert result is False
+        assert hotkey_manager.get_binding("test") is None
+
+    def test_failed_register_keeps_existing_dispatch(self, hotkey_manager, mock_platform_adapter):
+        """Test a failed registration does not drop another binding of the same hotkey."""
+        callback = Mock()
+        hotkey_manager.register_hotkey("first", "ctrl+t", callback)
+        platform_callback = mock_platform_adapter.register_hotkey.call_args[0][1]
+
+        mock_platform_adapter.register_hotkey.return_value = False
+        assert hotkey_manager.register_hotkey("second", "ctrl+t", Mock()) is False
+
+        platform_callback()
+        callback.assert_called_once_with()
+
+    def test_register_hotkey_replaces_existing(self, hotkey_manager, mock_platform_adapter):
+        """Test re-registering a binding id replaces the old hotkey."""
+        hotkey_manager.register_hotkey("test", "ctrl+t", Mock())
+
+        assert hotkey_manager.register_hotkey("test", "ctrl+y", Mock()) is True
+        assert hotkey_manager.get_binding("test").hotkey == "ctrl+y"
+        mock_platform_adapter.unregister_hotkey.assert_called_once_with("ctrl+t")
+
+    def test_start_and_reload_register_configured_hotkeys(self, hotkey_manager):
+        """Test start/reload register the configured terminal hotkey."""
+        assert hotkey_manager.start() is True
+        assert hotkey_manager.get_binding("config_terminal") is not None
+
+        assert hotkey_manager.reload_configuration() is True
+        assert hotkey_manager.get_binding("config_terminal") is not None
+
+    def test_reload_only_replaces_configured_bindings(self, hotkey_manager, mock_platform_adapter):
+        """Test reload unregisters config_ bindings and keeps user bindings."""
+        hotkey_manager.start()
+        hotkey_manager.register_hotkey("user", "ctrl+u", Mock())
+
+        hotkey_manager.reload_configuration()
+
+        unregistered = [c[0][0] for c in mock_platform_adapter.unregister_hotkey.call_args_list]
+        assert len(unregistered) == 1
+        assert "ctrl+u" not in unregistered
+        assert hotkey_manager.get_binding("user") is not None
+
+    def test_unregister_hotkey(self, hotkey_manager, mock_platform_adapter):
+        """Test unregistering a hotkey binding."""
+        hotkey_manager.register_hotkey("test", "ctrl+t", Mock())
+
+        result = hotkey_manager.unregister_hotkey("test")
+
+        assert result is True
+        assert hotkey_manager.get_binding("test") is None
+        mock_platform_adapter.unregister_hotkey.assert_called_once_with("ctrl+t")
+
+    def test_get_bindings_is_read_only_view(self, hotkey_manager):
+        """Test get_bindings returns a live read-only view."""
+        bindings = hotkey_manager.get_bindings()
+        hotkey_manager.register_hotkey("test", "ctrl+t", Mock())
+
+        assert "test" in bindings
+        with pytest.raises(TypeError):
+            bindings["other"] = None
+
+        snapshot = hotkey_manager.snapshot_bindings()
+        hotkey_manager.unregister_hotkey("test")
+        assert "test" in snapshot
+
+    def test_unregister_unknown_hotkey(self, hotkey_manager):
+        """Test unregistering a binding that does not exist."""
+        assert hotkey_manager.unregister_hotkey("missing") is False
+
+    def test_stop_unregisters_all_at_once(self, hotkey_manager, mock_platform_adapter):
+        """Test stopping uses the adapter's bulk unregistration."""
+        hotkey_manager._active = True
+        hotkey_manager.register_hotkey("first", "ctrl+t", Mock())
+        hotkey_manager.register_hotkey("second", "ctrl+b", Mock())
+
+        assert hotkey_manager.stop() is True
+        assert hotkey_manager.get_bindings() == {}
+        mock_platform_adapter.unregister_all_hotkeys.assert_called_once_with()
+        mock_platform_adapter.unregister_hotkey.assert_not_called()
+
+    def test_stop_falls_back_to_per_hotkey(self, hotkey_manager, mock_platform_adapter):
+        """Test stopping when the adapter has no bulk unregistration."""
+        mock_platform_adapter.unregister_all_hotkeys.return_value = False
+        hotkey_manager._active = True
+        hotkey_manager.register_hotkey("first", "ctrl+t", Mock())
+
+        assert hotkey_manager.stop() is True
+        assert hotkey_manager.get_bindings() == {}
+        mock_platform_adapter.unregister_hotkey.assert_called_once_with("ctrl+t")
+
+    def test_format_bindings_list_empty(self, hotkey_manager):
+        """Test formatting when no bindings are registered."""
+        assert hotkey_manager.format_bindings_list() == "No hotkey bindings registered."
+
+    def test_format_bindings_list(self, hotkey_manager):
+        """Test formatting registered bindings."""
+        hotkey_manager.register_hotkey("first", "ctrl+t", Mock(), "Open terminal")
+        hotkey_manager.register_hotkey("second", "ctrl+b", Mock())
+        hotkey_manager.disable_hotkey("second")
+
+        result = hotkey_manager.format_bindings_list()
+
+        assert result == (
+            "Registered Hotkey Bindings:\n"
+            "  first: ctrl+t (enabled) - Open terminal\n"
+            "  second: ctrl+b (disabled) - No description"
+        )
+
+    def test_get_platform_hotkey(self, hotkey_manager, config_manager):
+        """Test platform hotkey lookup and cache invalidation on config changes."""
+        hotkey_manager.current_platform = "linux"
+        assert hotkey_manager.get_platform_hotkey() == "ctrl+alt+t"
+
+        settings = config_manager.get_settings()
+        settings.hotkeys.terminal_linux = "ctrl+alt+y"
+        config_manager.update_settings(settings)
+
+        assert hotkey_manager.get_platform_hotkey() == "ctrl+alt+y"
+
+    def test_is_terminal_window(self, hotkey_manager):
+        """Test terminal detection against configured and common names."""
+        terminal_manager = Mock()
+        terminal_manager.get_available_terminals.return_value = ['test_app']
+        iterm = WindowInfo("1", "shell", "iTerm2", False, False)
+        custom = WindowInfo("2", "app", "Test Application", False, False)
+        browser = WindowInfo("3", "page", "Safari", False, False)
+
+        assert hotkey_manager._is_terminal_window(iterm, terminal_manager) is True
+        assert hotkey_manager._is_terminal_window(custom, terminal_manager) is True
+        assert hotkey_manager._is_terminal_window(browser, terminal_manager) is False
+        terminal_manager.get_available_terminals.assert_called_once()
+
+
+class TestHotkeyBinding:
+    """Test cases for HotkeyBinding class."""
+
+    def test_binding_defaults(self):
+        """Test HotkeyBinding default values and mutability."""
+        binding = HotkeyBinding(hotkey="ctrl+t", callback=Mock(), description="")
+
+        assert binding.enabled is True
+        binding.enabled = False
+        assert binding.enabled is False
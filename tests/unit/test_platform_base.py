@@ -1,4 +1,6 @@
 """Unit tests for platform base classes."""
+import sys
+
 import pytest
 from unittest.mock import Mock
 
@@ -40,6 +42,16 @@ class TestWindowInfo:
         
         assert window.position == (0, 0)
         assert window.size == (0, 0)
+        assert window.app_name_lower == "test app"
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_window_info_uses_slots(self):
+        """Test WindowInfo and AppInfo instances carry no __dict__."""
+        window = WindowInfo("1", "Title", "App", False, False)
+        app = AppInfo(pid=1, name="App", executable_path="", windows=[window])
+        
+        assert not hasattr(window, '__dict__')
+        assert not hasattr(app, '__dict__')
 
 
 class TestAppInfo:
@@ -163,6 +175,13 @@ class TestPlatformAdapter:
         assert adapter.get_running_apps() == []
         assert adapter.activate_window("123") is True
         assert adapter.is_app_running("test") is False
+        
+        # Bulk hotkey unregistration is optional and reports unsupported
+        assert adapter.unregister_all_hotkeys() is False
+        
+        # Grouped queries are optional; the default context does nothing
+        with adapter.oneshot():
+            assert adapter.get_running_apps() == []
 
 
 class MockPlatformAdapter(PlatformAdapter):